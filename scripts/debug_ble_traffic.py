@@ -12,18 +12,24 @@ Usage:
 
 import argparse
 import asyncio
+import signal
 import sys
-from datetime import datetime
+import time
+from collections import Counter
 from pathlib import Path
+from typing import Any, Dict
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from bleak import BleakClient
+# bleak (via bbl_shutter_cam.ble) is imported inside debug_ble_traffic() so that
+# --help and argument errors don't pay for loading it and its D-Bus bindings.
 from bbl_shutter_cam.config import DEFAULT_CONFIG_PATH, load_profile
-from bbl_shutter_cam.ble import connect_with_retry, list_notify_characteristics
 from bbl_shutter_cam.util import configure_logging, LOG
 
+# Pre-formatted decimal column entries, indexed by byte value.
+_DEC = tuple(f"{i:3d}" for i in range(256))
+
 
 async def debug_ble_traffic(mac: str, duration: float = 120.0):
     """
@@ -33,8 +39,21 @@ async def debug_ble_traffic(mac: str, duration: float = 120.0):
         mac: MAC address of the device
         duration: How long to listen (seconds). 0 = infinite.
     """
+    from bbl_shutter_cam.ble import (
+        connect_with_retry,
+        list_notify_characteristics,
+        start_notify_best_effort,
+    )
+
     LOG.info(f"Connecting to {mac}…")
-    client = await connect_with_retry(mac)
+    loop = asyncio.get_running_loop()
+    disconnected = asyncio.Event()
+
+    # Bleak may call this from outside the event loop thread
+    def on_disconnect(_client: Any) -> None:
+        loop.call_soon_threadsafe(disconnected.set)
+
+    client = await connect_with_retry(mac, disconnected_callback=on_disconnect)
 
     try:
         LOG.info("Connected. Discovering NOTIFY characteristics…")
@@ -48,39 +67,32 @@ async def debug_ble_traffic(mac: str, duration: float = 120.0):
             LOG.error("No NOTIFY characteristics found.")
             return
 
-        # Track which UUIDs have data
-        seen_data = {}
-
-        def make_callback(uuid: str):
-            def callback(_sender: int, data: bytearray) -> None:
-                b = bytes(data)
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        # Count each distinct payload per UUID
+        seen_data: Dict[str, Counter] = {}
 
-                # Track this UUID
-                if uuid not in seen_data:
-                    seen_data[uuid] = []
-                seen_data[uuid].append(b)
+        # One callback for every characteristic; the sender says which one fired
+        def callback(sender: Any, data: bytearray) -> None:
+            uuid = sender.uuid
+            now = time.time()
+            timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+            millis = int((now % 1) * 1000)
 
-                # Print in human-readable format
-                hex_str = b.hex().upper()
-                dec_values = " ".join(f"{byte:3d}" for byte in b)
-                print(f"[{timestamp}] {uuid}")
-                print(f"           HEX: {hex_str}")
-                print(f"           DEC: {dec_values}")
-                print(f"           LEN: {len(b)} bytes")
-                print()
+            # Only the stored key needs an immutable copy
+            seen_data.setdefault(uuid, Counter())[bytes(data)] += 1
 
-            return callback
+            # Print in human-readable format with a single write
+            sys.stdout.write(
+                f"[{timestamp}.{millis:03d}] {uuid}\n"
+                f"           HEX: {data.hex().upper()}\n"
+                f"           DEC: {' '.join(map(_DEC.__getitem__, data))}\n"
+                f"           LEN: {len(data)} bytes\n\n"
+            )
 
-        # Subscribe to all
+        # Subscribe to all at once rather than one GATT round-trip after another
         LOG.info("Subscribing to all NOTIFY characteristics…")
-        active = []
-        for uuid in notify_uuids:
-            try:
-                await client.start_notify(uuid, make_callback(uuid))
-                active.append(uuid)
-            except Exception as e:
-                LOG.warning(f"Failed to subscribe to {uuid}: {e}")
+        active = await start_notify_best_effort(
+            client, notify_uuids, lambda _uuid: callback, warn_failures=True
+        )
 
         LOG.info(f"Successfully subscribed to {len(active)}/{len(notify_uuids)} characteristics")
         print()
@@ -89,16 +101,30 @@ async def debug_ble_traffic(mac: str, duration: float = 120.0):
             print(f"Listening for {int(duration)} seconds…")
             print("(Trigger your device now to see the signals)")
             print()
-            await asyncio.sleep(duration)
+            # Stop at the deadline or as soon as the link drops, whichever is first
+            try:
+                await asyncio.wait_for(disconnected.wait(), timeout=duration)
+                LOG.warning("Device disconnected; ending capture early.")
+            except asyncio.TimeoutError:
+                pass
         else:
             print("Listening indefinitely…")
             print("Press Ctrl+C to exit")
             print()
             try:
-                while client.is_connected:
-                    await asyncio.sleep(1)
+                loop.add_signal_handler(signal.SIGINT, disconnected.set)
+            except NotImplementedError:
+                pass  # e.g. Windows: fall back to KeyboardInterrupt
+            try:
+                await disconnected.wait()
+                print("\nExiting…")
             except (KeyboardInterrupt, asyncio.CancelledError):
                 print("\nExiting…")
+            finally:
+                try:
+                    loop.remove_signal_handler(signal.SIGINT)
+                except NotImplementedError:
+                    pass
 
         # Summary
         if seen_data:
@@ -106,17 +132,9 @@ async def debug_ble_traffic(mac: str, duration: float = 120.0):
             print("SUMMARY OF OBSERVED SIGNALS")
             print("=" * 60)
             for uuid in sorted(seen_data.keys()):
-                signals = seen_data[uuid]
-                unique_signals = {}
-                for sig in signals:
-                    hex_sig = sig.hex().upper()
-                    if hex_sig not in unique_signals:
-                        unique_signals[hex_sig] = 0
-                    unique_signals[hex_sig] += 1
-
                 print(f"\n{uuid}:")
-                for hex_sig, count in sorted(unique_signals.items(), key=lambda x: -x[1]):
-                    print(f"  {hex_sig:20s} (received {count} time(s))")
+                for sig, count in seen_data[uuid].most_common():
+                    print(f"  {sig.hex().upper():20s} (received {count} time(s))")
         else:
             print("\nNo signals received.")
 
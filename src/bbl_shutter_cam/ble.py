@@ -4,6 +4,7 @@ Provides low-level BLE device operations using the Bleak library:
     - Async connection with automatic retry
     - Service and characteristic discovery
     - Notification subscription with error handling
+    - Batched notification delivery (NotifyRing)
     - Cross-version Bleak API compatibility
 
 All operations are async/await and non-blocking.
@@ -12,26 +13,84 @@ All operations are async/await and non-blocking.
 from __future__ import annotations
 
 import asyncio
-from typing import Callable, Iterable, List
+import random
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 from bleak import BleakClient
+from bleak.backends.characteristic import BleakGATTCharacteristic
 
 from .util import LOG
 
 # Type alias for BLE notification callbacks
-NotifyCallback = Callable[[int, bytearray], None]
+NotifyCallback = Callable[[BleakGATTCharacteristic, bytearray], None]
 
+# Both device caches are keyed by the uppercased MAC, so a lowercase MAC from
+# config matches the address the Bleak backend reports.
 
-async def connect_with_retry(mac: str, reconnect_delay: float = 2.0) -> BleakClient:
+# MACs whose GATT services have been fully discovered. Later connects ask
+# Bleak to reuse its cached attribute tree instead of running a fresh service
+# discovery round-trip.
+_SERVICE_CACHE: Set[str] = set()
+
+# NOTIFY characteristic UUIDs per device MAC (invariant for a given service layout).
+_NOTIFY_UUID_CACHE: Dict[str, List[str]] = {}
+
+
+def invalidate_cache(mac: str) -> None:
+    """Forget cached GATT services for a device.
+
+    Call this when the device reports a "Service Changed" indication (e.g.
+    after a firmware update) so the next connect performs full discovery.
+    Failed connects and notification subscriptions call it too, since a
+    stale cached attribute tree is a likely cause.
+
+    Args:
+        mac: MAC address of device (e.g., "AA:BB:CC:DD:EE:FF")
+    """
+    key = mac.upper()
+    _SERVICE_CACHE.discard(key)
+    _NOTIFY_UUID_CACHE.pop(key, None)
+
+
+def backoff_delay(attempt: int, min_delay: float, max_delay: float) -> float:
+    """Return the jittered exponential backoff delay for a retry attempt.
+
+    The delay doubles from min_delay with each attempt up to max_delay, then
+    is scaled by a random factor in [0.5, 1.5) so that several cameras
+    watching one printer don't retry in lockstep.
+
+    Args:
+        attempt: Zero-based number of failed attempts so far
+        min_delay: Delay before the first retry, in seconds
+        max_delay: Upper bound for the un-jittered delay, in seconds
+
+    Returns:
+        float: Seconds to wait before the next attempt
+    """
+    return min(max_delay, min_delay * 2.0 ** min(attempt, 32)) * random.uniform(0.5, 1.5)
+
+
+async def connect_with_retry(
+    mac: str,
+    reconnect_delay: float = 2.0,
+    disconnected_callback: Optional[Callable[[BleakClient], None]] = None,
+    max_delay: Optional[float] = None,
+) -> BleakClient:
     """Connect to a BLE device with automatic retry on failure.
 
-    Loops indefinitely attempting connection, waiting reconnect_delay seconds
-    between attempts. Useful for battery-powered devices that may only respond
-    when awake (e.g., after a button press).
+    Loops indefinitely attempting connection, backing off exponentially (with
+    jitter) from reconnect_delay up to max_delay between attempts. Useful for
+    battery-powered devices that may only respond when awake (e.g., after a
+    button press).
 
     Args:
         mac: MAC address of device (e.g., "AA:BB:CC:DD:EE:FF")
-        reconnect_delay: Seconds to wait between connection attempts
+        reconnect_delay: Seconds to wait before the first retry
+        disconnected_callback: Optional callable passed to BleakClient and
+                               invoked with the client when the link drops
+        max_delay: Cap for the backoff delay; defaults to reconnect_delay,
+                   which keeps the (jittered) delay constant
 
     Returns:
         BleakClient: Connected client instance (is_connected == True)
@@ -39,17 +98,36 @@ async def connect_with_retry(mac: str, reconnect_delay: float = 2.0) -> BleakCli
     Note:
         This function blocks indefinitely if the device is not available.
         The caller should implement a timeout if needed.
+
+        After the first successful connect the resolved services are cached
+        per MAC, and reconnects pass ``dangerous_use_bleak_cache=True`` so
+        service discovery is skipped. A failed attempt drops the cache so the
+        next one rediscovers; invalidate_cache() forces this explicitly.
     """
+    if max_delay is None:
+        max_delay = reconnect_delay
+    key = mac.upper()
+    attempt = 0
     while True:
         try:
-            client = BleakClient(mac)
-            await client.connect()
+            if disconnected_callback is None:
+                client = BleakClient(mac)
+            else:
+                client = BleakClient(mac, disconnected_callback=disconnected_callback)
+            if key in _SERVICE_CACHE:
+                await client.connect(dangerous_use_bleak_cache=True)
+            else:
+                await client.connect()
             if client.is_connected:
-                LOG.debug(f"BLE connected: {mac}")
+                LOG.debug("BLE connected: %s", mac)
+                if getattr(client, "services", None):
+                    _SERVICE_CACHE.add(key)
                 return client
         except Exception as e:
-            LOG.debug(f"BLE connect failed ({mac}): {e.__class__.__name__}: {e}")
-        await asyncio.sleep(reconnect_delay)
+            LOG.debug("BLE connect failed (%s): %s: %s", mac, e.__class__.__name__, e)
+            invalidate_cache(mac)
+        await asyncio.sleep(backoff_delay(attempt, reconnect_delay, max_delay))
+        attempt += 1
 
 
 async def get_services_compat(client: BleakClient):
@@ -57,7 +135,7 @@ async def get_services_compat(client: BleakClient):
 
     Some versions of Bleak expose services via await client.get_services(),
     while others populate client.services asynchronously. This helper handles
-    both patterns transparently.
+    both patterns transparently, waiting up to 5 seconds for the latter.
 
     Args:
         client: Connected BleakClient instance
@@ -74,11 +152,19 @@ async def get_services_compat(client: BleakClient):
             return await gs()
         return gs()
 
-    for _ in range(25):
+    # Poll with a short exponential backoff (10 ms doubling up to 100 ms) so
+    # services that are already resolved are picked up almost immediately.
+    waited = 0.0
+    delay = 0.01
+    while True:
         services = getattr(client, "services", None)
         if services:
             return services
-        await asyncio.sleep(0.2)
+        if waited >= 5.0:
+            break
+        await asyncio.sleep(delay)
+        waited += delay
+        delay = min(delay * 2, 0.1)
 
     raise RuntimeError("Service discovery failed: BleakClient.services never populated.")
 
@@ -87,7 +173,8 @@ async def list_notify_characteristics(client: BleakClient) -> List[str]:
     """List UUIDs of all characteristics that support notifications.
 
     Discovers all services and their characteristics, filtering to those
-    with the "notify" property set.
+    with the "notify" property set. The result is cached on the client and
+    per device MAC, so repeat calls and reconnects skip the walk.
 
     Args:
         client: Connected BleakClient instance
@@ -102,27 +189,42 @@ async def list_notify_characteristics(client: BleakClient) -> List[str]:
         >>>     print(uuid)
         180a0000-0000-1000-8000-00805f9b34fb
     """
+    cached = getattr(client, "_notify_uuids_cache", None)
+    address = getattr(client, "address", None)
+    mac = address.upper() if isinstance(address, str) else None
+    if cached is None and mac is not None:
+        cached = _NOTIFY_UUID_CACHE.get(mac)
+    if cached is not None:
+        return list(cached)
+
     services = await get_services_compat(client)
     notify_uuids: List[str] = []
+    append = notify_uuids.append
 
     for svc in services:
         for ch in svc.characteristics:
-            props = set(getattr(ch, "properties", []) or [])
-            if "notify" in props:
-                notify_uuids.append(ch.uuid)
+            if "notify" in ch.properties:
+                append(ch.uuid)
 
-    LOG.debug(f"Found {len(notify_uuids)} notify characteristic(s)")
-    return notify_uuids
+    LOG.debug("Found %d notify characteristic(s)", len(notify_uuids))
+    try:
+        setattr(client, "_notify_uuids_cache", notify_uuids)
+    except AttributeError:
+        pass
+    if mac is not None:
+        _NOTIFY_UUID_CACHE[mac] = notify_uuids
+    return list(notify_uuids)
 
 
 async def start_notify_best_effort(
     client: BleakClient,
     uuids: Iterable[str],
     callback_factory: Callable[[str], NotifyCallback],
+    warn_failures: bool = False,
 ) -> List[str]:
     """Subscribe to notifications on multiple characteristics with error tolerance.
 
-    Attempts to subscribe to each UUID, silently skipping any that fail.
+    Subscribes to all UUIDs concurrently, skipping any that fail.
     Uses a callback_factory that receives the UUID and returns a callback function
     to handle notifications.
 
@@ -130,7 +232,9 @@ async def start_notify_best_effort(
         client: Connected BleakClient instance
         uuids: Iterable of characteristic UUIDs to subscribe to
         callback_factory: Function that takes a UUID string and returns a NotifyCallback
-                         (function with signature: callback(sender: int, data: bytearray))
+                         (function with signature: callback(sender, data: bytearray),
+                         where sender is the BleakGATTCharacteristic)
+        warn_failures: Log failed subscriptions as warnings instead of debug lines
 
     Returns:
         List[str]: UUIDs that successfully subscribed
@@ -143,21 +247,30 @@ async def start_notify_best_effort(
         >>> active = await start_notify_best_effort(client, uuids, create_callback)
         >>> print(f"Subscribed to {len(active)} characteristics")
     """
+    uuids = list(uuids)
+    results = await asyncio.gather(
+        *(client.start_notify(uuid, callback_factory(uuid)) for uuid in uuids),
+        return_exceptions=True,
+    )
+
     active: List[str] = []
-    for uuid in uuids:
-        try:
-            await client.start_notify(uuid, callback_factory(uuid))  # type: ignore[arg-type]
-            active.append(uuid)
-        except Exception as e:
-            LOG.debug(f"start_notify failed for {uuid}: {e.__class__.__name__}: {e}")
+    for uuid, result in zip(uuids, results):
+        if isinstance(result, Exception):
+            if warn_failures:
+                LOG.warning("Failed to subscribe to %s: %s", uuid, result)
+            else:
+                LOG.debug(
+                    "start_notify failed for %s: %s: %s", uuid, result.__class__.__name__, result
+                )
             continue
+        active.append(uuid)
     return active
 
 
 async def stop_notify_best_effort(client: BleakClient, uuids: Iterable[str]) -> None:
     """Unsubscribe from notifications with error tolerance.
 
-    Attempts to stop notifications on each UUID. Failures are silently ignored,
+    Stops notifications on all UUIDs concurrently. Failures are silently ignored,
     making this safe to call even if some subscriptions were never established.
 
     Args:
@@ -168,8 +281,57 @@ async def stop_notify_best_effort(client: BleakClient, uuids: Iterable[str]) ->
         >>> await stop_notify_best_effort(client, ["uuid1", "uuid2"])
         >>> # Client no longer receives notifications
     """
-    for uuid in uuids:
-        try:
-            await client.stop_notify(uuid)
-        except Exception:
-            pass
+    await asyncio.gather(*(client.stop_notify(uuid) for uuid in uuids), return_exceptions=True)
+
+
+class NotifyRing:
+    """Bounded buffer that coalesces BLE notifications into batched wakeups.
+
+    callback() (one function for every characteristic, keyed on the sender's
+    UUID) and callbacks from callback_factory() only append (uuid, payload)
+    and set an event, so no printing or logging happens in the notification
+    path. A single consumer task awaits drain() and handles everything that
+    arrived since its last wakeup in one pass. When the buffer is full the
+    oldest entries are dropped.
+
+    Args:
+        maxlen: Maximum number of buffered notifications
+
+    Example:
+        >>> ring = NotifyRing()
+        >>> await start_notify_best_effort(client, uuids, lambda _uuid: ring.callback)
+        >>> for uuid, payload in await ring.drain():
+        ...     print(uuid, payload.hex())
+    """
+
+    def __init__(self, maxlen: int = 1024) -> None:
+        self.deque: Deque[Tuple[str, bytes]] = deque(maxlen=maxlen)
+        self.event = asyncio.Event()
+
+    def callback(self, sender: BleakGATTCharacteristic, data: bytearray) -> None:
+        """Notification callback for any characteristic; buffers (sender UUID, payload)."""
+        self.deque.append((sender.uuid, bytes(data)))
+        self.event.set()
+
+    def callback_factory(self, uuid: str) -> NotifyCallback:
+        """Create a notification callback that buffers payloads from uuid."""
+        append = self.deque.append
+        wake = self.event.set
+
+        def _cb(_sender: BleakGATTCharacteristic, data: bytearray) -> None:
+            append((uuid, bytes(data)))
+            wake()
+
+        return _cb
+
+    def pop_all(self) -> List[Tuple[str, bytes]]:
+        """Remove and return everything currently buffered, without waiting."""
+        items = list(self.deque)
+        self.deque.clear()
+        self.event.clear()
+        return items
+
+    async def drain(self) -> List[Tuple[str, bytes]]:
+        """Wait until at least one notification is buffered, then pop them all."""
+        await self.event.wait()
+        return self.pop_all()
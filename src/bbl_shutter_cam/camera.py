@@ -4,6 +4,7 @@ Provides structures and utilities for:
     - Configuring rpicam-still capture parameters
     - Loading camera settings from TOML profiles
     - Building rpicam-still command-line invocations
+    - Persistent in-process capture via Picamera2 (when installed)
     - Managing output file naming and directories
 
 All camera settings are exposed as configuration options with sensible defaults.
@@ -11,10 +12,17 @@ All camera settings are exposed as configuration options with sensible defaults.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import os
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .util import LOG
+
+# Parent of the per-profile default output directories (resolved once per process)
+_CAPTURES_ROOT = Path.home() / "captures"
 
 
 @dataclass(frozen=True)
@@ -46,6 +54,8 @@ class CameraConfig:
         lens_position: Manual lens position (float, 0.0=infinity to ~32.0=close)
         quality: JPEG quality (integer, 0-100)
         timeout: Capture timeout in milliseconds
+        static_argv: rpicam-still flags other than "-o <outfile>", derived from the
+            fields above at construction time
     """
 
     output_dir: str
@@ -84,8 +94,40 @@ class CameraConfig:
     quality: Optional[int] = None  # JPEG quality 0-100
     timeout: Optional[int] = None  # milliseconds
 
-
-def camera_config_from_profile(profile: Dict[str, Any]) -> CameraConfig:
+    # Derived: precomputed once since the config is immutable
+    static_argv: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "static_argv", _compute_static_argv(self))
+
+
+# camera.rpicam option -> accepted TOML value types (bools are also accepted as 0/1)
+_RPICAM_TYPES: Dict[str, Tuple[type, ...]] = {
+    "width": (int,),
+    "height": (int,),
+    "nopreview": (bool, int),
+    "rotation": (int,),
+    "hflip": (bool, int),
+    "vflip": (bool, int),
+    "awb": (str,),
+    "ev": (int, float),
+    "denoise": (str,),
+    "sharpness": (int, float),
+    "shutter": (int,),
+    "gain": (int, float),
+    "awbgains": (str,),
+    "saturation": (int, float),
+    "contrast": (int, float),
+    "brightness": (int, float),
+    "metering": (str,),
+    "autofocus_mode": (str,),
+    "lens_position": (int, float),
+    "quality": (int,),
+    "timeout": (int,),
+}
+
+
+def camera_config_from_profile(profile: Mapping[str, Any]) -> CameraConfig:
     """Load camera configuration from a profile dictionary.
 
     Extracts camera settings from a profile dict (typically from config.py's
@@ -101,6 +143,10 @@ def camera_config_from_profile(profile: Dict[str, Any]) -> CameraConfig:
     Returns:
         CameraConfig: Configured camera settings with defaults applied.
 
+    Raises:
+        ValueError: If a camera.rpicam option cannot be converted to its type, or
+            camera.filename_format is not a usable strftime format
+
     Example:
         >>> config = load_profile(path, "my-printer")
         >>> cam = camera_config_from_profile(config)
@@ -112,44 +158,101 @@ def camera_config_from_profile(profile: Dict[str, Any]) -> CameraConfig:
 
     # Default output_dir includes profile name to prevent file collision
     profile_name = profile.get("_profile_name", "default")
-    default_output = str(Path.home() / "captures" / profile_name)
+    default_output = str(_CAPTURES_ROOT / profile_name)
     output_dir = cam.get("output_dir", default_output)
     filename_format = cam.get("filename_format", "%Y%m%d_%H%M%S.jpg")
     min_interval_sec = float(cam.get("min_interval_sec", 0.5))
 
+    _validate_filename_format(str(filename_format))
+
+    unknown = sorted(set(rp) - _RPICAM_TYPES.keys())
+    if unknown:
+        LOG.warning(f"Ignoring unknown camera.rpicam option(s): {', '.join(unknown)}")
+
+    # Missing options fall back to the CameraConfig field defaults
+    options: Dict[str, Any] = {}
+    for name, types in _RPICAM_TYPES.items():
+        if name not in rp:
+            continue
+        options[name] = _coerce_rpicam(name, rp[name], types)
+
     return CameraConfig(
         output_dir=str(output_dir),
         filename_format=str(filename_format),
         min_interval_sec=min_interval_sec,
-        width=rp.get("width", 1920),
-        height=rp.get("height", 1080),
-        nopreview=bool(rp.get("nopreview", True)),
-        rotation=rp.get("rotation"),
-        hflip=bool(rp.get("hflip", False)),
-        vflip=bool(rp.get("vflip", False)),
-        awb=rp.get("awb"),
-        ev=rp.get("ev"),
-        denoise=rp.get("denoise"),
-        sharpness=rp.get("sharpness"),
-        shutter=rp.get("shutter"),
-        gain=rp.get("gain"),
-        awbgains=rp.get("awbgains"),
-        saturation=rp.get("saturation"),
-        contrast=rp.get("contrast"),
-        brightness=rp.get("brightness"),
-        metering=rp.get("metering"),
-        autofocus_mode=rp.get("autofocus_mode"),
-        lens_position=rp.get("lens_position"),
-        quality=rp.get("quality"),
-        timeout=rp.get("timeout"),
+        **options,
     )
 
 
+def _coerce_rpicam(name: str, value: Any, types: Tuple[type, ...]) -> Any:
+    """Convert one camera.rpicam value to its expected type.
+
+    Values that convert cleanly are accepted as older configs wrote them:
+    integral floats for integer options (``shutter = 10000.0``), numeric
+    strings (``width = "4056"``, ``ev = "0.5"``), numbers for string options
+    and true/false strings for flags.
+
+    Raises:
+        ValueError: If the value cannot be converted
+    """
+    # bool is an int subclass, so true/false would pass as a number otherwise
+    is_flag = types[0] is bool
+    if value is None or (isinstance(value, types) and not is_flag and not isinstance(value, bool)):
+        return value
+    try:
+        if is_flag:
+            if isinstance(value, (bool, int)):
+                return bool(value)
+            flag = str(value).strip().lower()
+            if flag in ("true", "false"):
+                return flag == "true"
+        elif types[0] is str:
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return str(value)
+        elif not isinstance(value, bool):
+            number = float(value) if isinstance(value, str) else value
+            if isinstance(number, float) and number.is_integer() and int in types:
+                return int(number)
+            if float in types and isinstance(number, (int, float)):
+                return number
+    except ValueError:
+        pass
+    expected = " or ".join(t.__name__ for t in types)
+    raise ValueError(
+        f"camera.rpicam.{name} must be {expected}, got {type(value).__name__}: {value!r}"
+    )
+
+
+def _validate_filename_format(fmt: str) -> None:
+    """Check a filename strftime format once at load time instead of per capture.
+
+    A format without any time-varying field is accepted with a warning, since
+    every capture would overwrite the same file.
+
+    Raises:
+        ValueError: If strftime rejects the format or it produces a path separator
+    """
+    try:
+        a = datetime(2000, 1, 1, 0, 0, 0).strftime(fmt)
+        b = datetime(2001, 2, 3, 4, 5, 6, 7000).strftime(fmt)
+    except ValueError as e:
+        raise ValueError(f"camera.filename_format {fmt!r} is invalid: {e}") from None
+    if os.sep in a:
+        raise ValueError(f"camera.filename_format {fmt!r} must not contain {os.sep!r}")
+    if a == b:
+        LOG.warning(
+            f"camera.filename_format {fmt!r} has no date/time fields; "
+            "each capture will overwrite the previous one"
+        )
+
+
 def make_outfile(cam: CameraConfig) -> str:
     """Generate output filename and ensure output directory exists.
 
     Uses the filename_format from config to create a timestamped filename
-    in the configured output directory. Creates the directory if it doesn't exist.
+    in the configured output directory. Creates the directory if it doesn't
+    exist; this is checked on every call, so a directory that was deleted or
+    unmounted since the last capture is created again.
 
     Args:
         cam: CameraConfig instance with output_dir and filename_format
@@ -163,34 +266,37 @@ def make_outfile(cam: CameraConfig) -> str:
         >>> print(path)
         /home/user/captures/20260214_123456.jpg
     """
-    out_dir = Path(cam.output_dir).expanduser()
-    out_dir.mkdir(parents=True, exist_ok=True)
-    name = datetime.now().strftime(cam.filename_format)
-    return str(out_dir / name)
+    out_dir = _expanded_dir(cam.output_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    return f"{out_dir}/{datetime.now().strftime(cam.filename_format)}"
 
 
-def build_rpicam_still_cmd(cam: CameraConfig, outfile: str) -> List[str]:
-    """Build an rpicam-still command from camera configuration.
+@functools.lru_cache(maxsize=8)
+def _expanded_dir(output_dir: str) -> str:
+    """Expand a configured output directory once per process.
 
-    Constructs the complete command-line arguments for rpicam-still based on
-    the configuration. Only includes parameters that are explicitly set
-    (None values are omitted).
+    Args:
+        output_dir: Output directory as configured (may contain ~)
+
+    Returns:
+        str: Expanded directory path without a trailing separator
+    """
+    return os.path.expanduser(output_dir).rstrip(os.sep) or os.sep
+
+
+def _compute_static_argv(cam: CameraConfig) -> Tuple[str, ...]:
+    """Build the rpicam-still flags that do not depend on the output file.
+
+    Called once from CameraConfig.__post_init__; the result is stored on the
+    (immutable) config as static_argv and reused for every capture.
 
     Args:
         cam: CameraConfig with capture parameters
-        outfile: Output file path (will be passed to -o flag)
 
     Returns:
-        List[str]: Complete command-line as list (ready for subprocess.run)
-
-    Example:
-        >>> cam = CameraConfig(width=1920, height=1080, rotation=90)
-        >>> cmd = build_rpicam_still_cmd(cam, "/tmp/test.jpg")
-        >>> cmd
-        ['rpicam-still', '-o', '/tmp/test.jpg', '--width', '1920',
-         '--height', '1080', '--rotation', '90', '--nopreview']
+        Tuple[str, ...]: Command-line flags following "-o <outfile>"
     """
-    cmd: List[str] = ["rpicam-still", "-o", outfile]
+    cmd: List[str] = []
 
     if cam.nopreview:
         cmd.append("--nopreview")
@@ -247,4 +353,233 @@ def build_rpicam_still_cmd(cam: CameraConfig, outfile: str) -> List[str]:
         cmd += ["--quality", str(cam.quality)]
     if cam.timeout is not None:
         cmd += ["--timeout", str(cam.timeout)]
-    return cmd
+    return tuple(cmd)
+
+
+def build_rpicam_still_cmd(cam: CameraConfig, outfile: str) -> List[str]:
+    """Build an rpicam-still command from camera configuration.
+
+    Constructs the complete command-line arguments for rpicam-still based on
+    the configuration. Only includes parameters that are explicitly set
+    (None values are omitted).
+
+    Args:
+        cam: CameraConfig with capture parameters
+        outfile: Output file path (will be passed to -o flag)
+
+    Returns:
+        List[str]: Complete command-line as list (ready for subprocess.run)
+
+    Example:
+        >>> cam = CameraConfig(width=1920, height=1080, rotation=90)
+        >>> cmd = build_rpicam_still_cmd(cam, "/tmp/test.jpg")
+        >>> cmd
+        ['rpicam-still', '-o', '/tmp/test.jpg', '--width', '1920',
+         '--height', '1080', '--rotation', '90', '--nopreview']
+    """
+    return ["rpicam-still", "-o", outfile, *cam.static_argv]
+
+
+# rpicam-still option values -> libcamera control enum member names
+_AWB_MODES = {
+    "auto": "Auto",
+    "incandescent": "Incandescent",
+    "tungsten": "Tungsten",
+    "fluorescent": "Fluorescent",
+    "indoor": "Indoor",
+    "daylight": "Daylight",
+    "cloudy": "Cloudy",
+    "custom": "Custom",
+}
+_METERING_MODES = {
+    "centre": "CentreWeighted",
+    "spot": "Spot",
+    "matrix": "Matrix",
+    "custom": "Custom",
+}
+_AF_MODES = {"manual": "Manual", "auto": "Auto", "continuous": "Continuous"}
+
+
+def _session_unsupported(cam: CameraConfig) -> List[str]:
+    """List the settings a CameraSession cannot apply, as "name=value" strings.
+
+    libcamera transforms only cover flips, so 90/270 degree rotations need
+    rpicam-still, as do denoise modes, the pre-capture timeout, a preview
+    window, and mode names without a libcamera equivalent.
+
+    Args:
+        cam: Camera configuration to check
+
+    Returns:
+        Offending settings; empty if the session can honour the configuration
+    """
+    return [
+        f"{name}={value}"
+        for name, value, ok in (
+            ("rotation", cam.rotation, cam.rotation in (None, 0, 180)),
+            ("denoise", cam.denoise, cam.denoise is None),
+            ("timeout", cam.timeout, cam.timeout is None),
+            ("nopreview", cam.nopreview, cam.nopreview),
+            ("awb", cam.awb, cam.awb is None or cam.awb in _AWB_MODES),
+            ("metering", cam.metering, cam.metering is None or cam.metering in _METERING_MODES),
+            (
+                "autofocus_mode",
+                cam.autofocus_mode,
+                cam.autofocus_mode is None or cam.autofocus_mode in _AF_MODES,
+            ),
+        )
+        if not ok
+    ]
+
+
+class CameraSession:
+    """Persistent in-process camera backed by Picamera2 (libcamera bindings).
+
+    rpicam-still pays for process start-up, camera pipeline initialisation and
+    tuning-file loading on every photo. A CameraSession configures the camera
+    once and keeps it running, so each capture() only encodes one frame.
+
+    Picamera2 is an optional, Pi-only dependency (``sudo apt install
+    python3-picamera2``); use open_camera_session() to get a session or None
+    and fall back to build_rpicam_still_cmd() otherwise.
+
+    Attributes:
+        cam: CameraConfig the camera was configured with
+    """
+
+    def __init__(self, cam: CameraConfig):
+        """Start the camera with settings from a CameraConfig.
+
+        Args:
+            cam: Camera configuration to apply
+
+        Raises:
+            ImportError: If picamera2/libcamera are not installed
+            ValueError: If the configuration cannot be expressed (see supports())
+        """
+        # pylint: disable=import-error
+        from libcamera import Transform, controls
+        from picamera2 import Picamera2
+
+        unsupported = _session_unsupported(cam)
+        if unsupported:
+            raise ValueError(f"{', '.join(unsupported)} requires rpicam-still")
+
+        self.cam = cam
+        flip = cam.rotation == 180
+        main = {}
+        if cam.width is not None and cam.height is not None:
+            main["size"] = (cam.width, cam.height)
+
+        self._picam2 = Picamera2()
+        try:
+            config = self._picam2.create_still_configuration(
+                main=main,
+                transform=Transform(hflip=cam.hflip != flip, vflip=cam.vflip != flip),
+            )
+            self._picam2.configure(config)
+            if cam.quality is not None:
+                self._picam2.options["quality"] = cam.quality
+            self._picam2.set_controls(self._controls(cam, controls))
+            self._picam2.start()
+        except Exception:
+            self._picam2.close()
+            raise
+
+    @staticmethod
+    def supports(cam: CameraConfig) -> bool:
+        """Check whether a configuration can be captured in-process.
+
+        Every setting must be applied exactly as rpicam-still would apply it,
+        otherwise the same profile would produce different photos depending
+        on whether Picamera2 is installed.
+
+        Args:
+            cam: Camera configuration to check
+
+        Returns:
+            True if CameraSession can honour every setting
+        """
+        return not _session_unsupported(cam)
+
+    @staticmethod
+    def _controls(cam: CameraConfig, controls: Any) -> Dict[str, Any]:
+        """Map CameraConfig fields onto libcamera control values.
+
+        Args:
+            cam: Camera configuration
+            controls: The ``libcamera.controls`` module
+
+        Returns:
+            Dict of control name -> value for Picamera2.set_controls()
+        """
+        ctrl: Dict[str, Any] = {}
+        if cam.awb is not None:
+            ctrl["AwbMode"] = getattr(controls.AwbModeEnum, _AWB_MODES[cam.awb])
+        if cam.ev is not None:
+            ctrl["ExposureValue"] = float(cam.ev)
+        if cam.sharpness is not None:
+            ctrl["Sharpness"] = float(cam.sharpness)
+        if cam.shutter is not None:
+            ctrl["ExposureTime"] = int(cam.shutter)
+        if cam.gain is not None:
+            ctrl["AnalogueGain"] = float(cam.gain)
+        if cam.awbgains is not None:
+            red, blue = (float(v) for v in str(cam.awbgains).split(","))
+            ctrl["ColourGains"] = (red, blue)
+        if cam.saturation is not None:
+            ctrl["Saturation"] = float(cam.saturation)
+        if cam.contrast is not None:
+            ctrl["Contrast"] = float(cam.contrast)
+        if cam.brightness is not None:
+            ctrl["Brightness"] = float(cam.brightness)
+        if cam.metering is not None:
+            ctrl["AeMeteringMode"] = getattr(
+                controls.AeMeteringModeEnum, _METERING_MODES[cam.metering]
+            )
+        if cam.autofocus_mode is not None:
+            ctrl["AfMode"] = getattr(controls.AfModeEnum, _AF_MODES[cam.autofocus_mode])
+        if cam.lens_position is not None:
+            ctrl["LensPosition"] = float(cam.lens_position)
+        return ctrl
+
+    def capture(self, outfile: str) -> None:
+        """Capture a still image to a file (blocks until written).
+
+        Args:
+            outfile: Output file path
+        """
+        self._picam2.capture_file(outfile)
+
+    def close(self) -> None:
+        """Stop the camera and release it for other processes."""
+        try:
+            self._picam2.stop()
+        finally:
+            self._picam2.close()
+
+
+def open_camera_session(cam: CameraConfig) -> Optional[CameraSession]:
+    """Open a persistent CameraSession if possible.
+
+    Args:
+        cam: Camera configuration to apply
+
+    Returns:
+        CameraSession, or None when Picamera2 is unavailable, the configuration
+        needs rpicam-still, or the camera fails to start. Callers should then
+        capture via build_rpicam_still_cmd().
+    """
+    unsupported = _session_unsupported(cam)
+    if unsupported:
+        LOG.debug("Not supported in-process (%s); using rpicam-still", ", ".join(unsupported))
+        return None
+    try:
+        return CameraSession(cam)
+    except ImportError:
+        LOG.debug("picamera2 not installed; using rpicam-still")
+    except Exception as e:
+        LOG.warning(
+            f"Persistent camera unavailable ({e.__class__.__name__}: {e}); using rpicam-still"
+        )
+    return None
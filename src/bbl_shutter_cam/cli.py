@@ -12,25 +12,47 @@ All commands use async/await for non-blocking BLE operations.
 from __future__ import annotations
 
 import argparse
-import asyncio
 import sys
 from pathlib import Path
+from typing import Any, Coroutine, TypeVar
 
-from . import discover, tune
+# discover (bleak), tune and asyncio are imported inside the command handlers
+# (or _async_run) so that --help, argument errors and unrelated commands
+# don't load them.
 from .config import DEFAULT_CONFIG_PATH, ensure_config_exists, load_profile
 from .util import LOG, configure_logging
 
+T = TypeVar("T")
 
-def _build_parser() -> argparse.ArgumentParser:
-    """Build and return the argument parser for all CLI commands.
+
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build and return the argument parser for the CLI.
+
+    Args:
+        command: If this names a known subcommand, only that subcommand's
+                 parser is attached; otherwise all subcommands are built.
 
     Returns:
-        argparse.ArgumentParser: Configured parser with all subcommands.
+        argparse.ArgumentParser: Configured parser with the requested subcommands.
     """
     p = argparse.ArgumentParser(
         prog="bbl-shutter-cam",
         description="Use a BBL_SHUTTER BLE trigger to capture photos with rpicam-still.",
     )
+    _add_global_args(p)
+
+    sub = p.add_subparsers(dest="command", required=True)
+    if command in _SUBCOMMANDS:
+        _SUBCOMMANDS[command](sub)
+    else:
+        for add_subcommand in _SUBCOMMANDS.values():
+            add_subcommand(sub)
+
+    return p
+
+
+def _add_global_args(p: argparse.ArgumentParser) -> None:
+    """Add the options shared by all commands (must precede the command name)."""
     p.add_argument(
         "--config",
         type=Path,
@@ -55,15 +77,33 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Optional log file path (append mode)",
     )
 
-    sub = p.add_subparsers(dest="command", required=True)
 
-    # scan
+def _peek_command(argv: list[str] | None) -> str | None:
+    """Return the subcommand name from argv without building any subparsers.
+
+    Returns None when help is requested so the full parser can list every command.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if "-h" in args or "--help" in args:
+        return None
+    pre = argparse.ArgumentParser(add_help=False)
+    _add_global_args(pre)
+    pre.add_argument("command", nargs="?")
+    try:
+        known, _rest = pre.parse_known_args(args)
+    except SystemExit:
+        return None
+    return known.command  # type: ignore[no-any-return]
+
+
+def _sub_scan(sub: argparse._SubParsersAction) -> None:
     scan = sub.add_parser("scan", help="Scan for BLE devices (optionally filter by name)")
     scan.add_argument("--name", default=None, help="Device name filter (e.g. BBL_SHUTTER)")
     scan.add_argument("--timeout", type=float, default=8.0, help="Scan duration seconds")
     scan.set_defaults(func=_cmd_scan)
 
-    # setup
+
+def _sub_setup(sub: argparse._SubParsersAction) -> None:
     setup = sub.add_parser(
         "setup", help="Create/update a profile and learn notify UUID by pressing the shutter"
     )
@@ -81,7 +121,8 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     setup.set_defaults(func=_cmd_setup)
 
-    # debug
+
+def _sub_debug(sub: argparse._SubParsersAction) -> None:
     debug = sub.add_parser(
         "debug", help="Capture all BLE signals to discover unknown triggers and update config"
     )
@@ -97,14 +138,19 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Automatically update config with discovered signals",
     )
+    debug.add_argument(
+        "--no-dec", action="store_true", help="Print only HEX and LEN for each signal (no DEC)"
+    )
     debug.set_defaults(func=_cmd_debug)
 
-    # tune
+
+def _sub_tune(sub: argparse._SubParsersAction) -> None:
     tune_cmd = sub.add_parser("tune", help="Interactive camera calibration and tuning")
     tune_cmd.add_argument("--profile", required=True, help="Profile name to tune (e.g. p1s-office)")
     tune_cmd.set_defaults(func=_cmd_tune)
 
-    # run
+
+def _sub_run(sub: argparse._SubParsersAction) -> None:
     run = sub.add_parser("run", help="Run listener for a profile")
     run.add_argument(
         "--profile", default=None, help="Profile name (default: config default_profile)"
@@ -112,11 +158,55 @@ def _build_parser() -> argparse.ArgumentParser:
     run.add_argument("--dry-run", action="store_true", help="Log presses but do not capture photos")
     run.add_argument("--verbose", action="store_true", help="Print BLE notification payloads")
     run.add_argument(
-        "--reconnect-delay", type=float, default=2.0, help="Seconds between reconnect attempts"
+        "--reconnect-min",
+        type=float,
+        default=1.0,
+        help="Seconds before the first reconnect retry (doubles per failure)",
+    )
+    run.add_argument(
+        "--reconnect-max",
+        type=float,
+        default=64.0,
+        help="Maximum seconds between reconnect retries",
+    )
+    run.add_argument(
+        "--reconnect-delay",
+        type=float,
+        default=None,
+        help="Deprecated: fixed seconds between retries (sets both --reconnect-min and -max)",
     )
     run.set_defaults(func=_cmd_run)
 
-    return p
+
+# Subcommand name -> function attaching its parser (in --help order)
+_SUBCOMMANDS = {
+    "scan": _sub_scan,
+    "setup": _sub_setup,
+    "debug": _sub_debug,
+    "tune": _sub_tune,
+    "run": _sub_run,
+}
+
+
+def _async_run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a command's coroutine to completion.
+
+    Uses uvloop's faster event loop when it is installed (optional extra
+    "fast"), otherwise the standard asyncio loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        import asyncio
+
+        return asyncio.run(coro)
+    return uvloop.run(coro)  # type: ignore[no-any-return]
 
 
 def _cmd_scan(args: argparse.Namespace) -> int:
@@ -133,7 +223,9 @@ def _cmd_scan(args: argparse.Namespace) -> int:
     Returns:
         0 on success, 1 if no devices found.
     """
-    devices = asyncio.run(discover.scan(name_filter=args.name, timeout=args.timeout))
+    from . import discover
+
+    devices = _async_run(discover.scan(name_filter=args.name, timeout=args.timeout))
 
     if not devices:
         if args.name:
@@ -182,10 +274,12 @@ def _cmd_setup(args: argparse.Namespace) -> int:
     Returns:
         0 on success, 1 on failure.
     """
-    cfg_path = Path(args.config).expanduser()
+    from . import discover
+
+    cfg_path = args.config
     ensure_config_exists(cfg_path)
 
-    result = asyncio.run(
+    result = _async_run(
         discover.setup_profile(
             config_path=cfg_path,
             profile=args.profile,
@@ -226,11 +320,12 @@ def _cmd_debug(args: argparse.Namespace) -> int:
             - mac: Optional MAC address (overrides profile config)
             - duration: Listen duration in seconds (0 = infinite)
             - update_config: Whether to auto-save discovered signals
+            - no_dec: Whether to omit the decimal column from the output
 
     Returns:
         0 on success, 1 on failure.
     """
-    cfg_path = Path(args.config).expanduser()
+    cfg_path = args.config
     ensure_config_exists(cfg_path)
 
     prof = load_profile(cfg_path, args.profile)
@@ -240,13 +335,16 @@ def _cmd_debug(args: argparse.Namespace) -> int:
         LOG.error(f"Profile '{args.profile}' has no MAC. Run setup first or provide --mac.")
         return 1
 
-    asyncio.run(
+    from . import discover
+
+    _async_run(
         discover.debug_signals(
             config_path=cfg_path,
             profile_name=args.profile,
             mac=mac,
             duration=args.duration,
             update_config=args.update_config,
+            show_dec=not args.no_dec,
         )
     )
     return 0
@@ -266,7 +364,9 @@ def _cmd_tune(args: argparse.Namespace) -> int:
     Returns:
         0 on success, 1 on failure.
     """
-    cfg_path = Path(args.config).expanduser()
+    from . import tune
+
+    cfg_path = args.config
     ensure_config_exists(cfg_path)
 
     return tune.tune_profile(cfg_path, args.profile)
@@ -287,21 +387,38 @@ def _cmd_run(args: argparse.Namespace) -> int:
             - profile: Profile name to use (or default_profile from config)
             - dry_run: If True, logs triggers but doesn't capture photos
             - verbose: Whether to print BLE notification payloads
-            - reconnect_delay: Seconds between reconnection attempts
+            - reconnect_min: Seconds before the first reconnection retry
+            - reconnect_max: Cap for the reconnection backoff in seconds
+            - reconnect_delay: Deprecated fixed retry delay (or None)
 
     Returns:
-        0 on normal exit, 1 on error (typically not reached due to Ctrl+C).
+        0 on normal exit, 1 on invalid camera settings or other error.
     """
-    cfg_path = Path(args.config).expanduser()
+    cfg_path = args.config
     ensure_config_exists(cfg_path)
 
     prof = load_profile(cfg_path, args.profile)
-    asyncio.run(
+    if args.reconnect_delay is not None:
+        LOG.warning("--reconnect-delay is deprecated; use --reconnect-min/--reconnect-max.")
+
+    from . import discover
+    from .camera import camera_config_from_profile
+
+    # Report bad camera settings before connecting rather than with a traceback
+    try:
+        camera_config_from_profile(prof)
+    except ValueError as e:
+        LOG.error(f"Invalid camera settings in {cfg_path}: {e}")
+        return 1
+
+    _async_run(
         discover.run_profile(
             prof,
             dry_run=args.dry_run,
             verbose=args.verbose,
             reconnect_delay=args.reconnect_delay,
+            reconnect_min=args.reconnect_min,
+            reconnect_max=args.reconnect_max,
         )
     )
     return 0
@@ -319,8 +436,12 @@ def main(argv: list[str] | None = None) -> None:
     Raises:
         SystemExit: With exit code 0 on success, 1 on error, 2 on bad arguments.
     """
-    parser = _build_parser()
+    # Only the invoked subcommand's parser is built; --help and unknown
+    # commands get the full parser so usage lists every command.
+    parser = _build_parser(_peek_command(argv))
     args = parser.parse_args(argv)
+    # Normalize once so handlers (and the config cache key) see an absolute path
+    args.config = Path(args.config).expanduser().resolve()
 
     # Initialize logging early
     configure_logging(
@@ -328,7 +449,7 @@ def main(argv: list[str] | None = None) -> None:
         fmt=args.log_format,
         log_file=args.log_file,
     )
-    LOG.debug(f"Using config: {args.config}")
+    LOG.debug("Using config: %s", args.config)
 
     func = getattr(args, "func", None)
     if not callable(func):
@@ -29,20 +29,167 @@ Configuration structure:
 
 from __future__ import annotations
 
+import copy
+import functools
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Tuple
+
+from .util import LOG
+
+# Read-only loads use the stdlib tomllib parser where available; tomlkit's
+# slower round-trip parser is only needed when a document is edited and
+# saved, so it is imported by the write paths only.
+if sys.version_info >= (3, 11):
+    import tomllib
+
+    def _load_readonly(path: Path) -> Dict[str, Any]:
+        # tomllib takes the binary file (TOML is always UTF-8), so there is no
+        # locale-dependent text layer or newline translation in between
+        with path.open("rb") as f:
+            return tomllib.load(f)
+
+else:
+
+    def _load_readonly(path: Path) -> Dict[str, Any]:
+        from tomlkit import parse
+
+        # unwrap() converts tomlkit's Container/Table proxies to plain dicts
+        return parse(path.read_text(encoding="utf-8")).unwrap()
 
-from tomlkit import document, dumps, parse
 
 APP_NAME = "bbl-shutter-cam"
-DEFAULT_CONFIG_PATH = Path.home() / ".config" / APP_NAME / "config.toml"
+_HOME = Path.home()
+DEFAULT_CONFIG_PATH = _HOME / ".config" / APP_NAME / "config.toml"
+
+# Initial config.toml with a minimal "default" profile (mac and notify_uuid
+# are learned during setup); output_dir is filled in as a TOML string literal
+_DEFAULT_CONFIG_TOML = """\
+default_profile = "default"
+
+[profiles.default.device]
+name = "BBL_SHUTTER"
+
+[profiles.default.camera]
+output_dir = {output_dir}
+filename_format = "%Y%m%d_%H%M%S.jpg"
+min_interval_sec = 0.5
+
+[profiles.default.camera.rpicam]
+width = 1920
+height = 1080
+nopreview = true
+"""
+
+# Config paths already known to exist in this process
+_ENSURED: set[Path] = set()
+
+# A trigger signature: one or more whole bytes written as hex digits
+_HEX_RE = re.compile(r"(?:[0-9a-fA-F]{2})+")
+
+# Default trigger signals for BBL_SHUTTER / Bambu devices, used when a profile
+# configures no events; shared and read-only so every caller gets the same objects
+_DEFAULT_EVENTS: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType(
+        {
+            "uuid": "00002a4d-0000-1000-8000-00805f9b34fb",
+            "hex": "4000",
+            "capture": True,
+            "name": "manual_button",
+        }
+    ),
+    MappingProxyType(
+        {
+            "uuid": "00002a4d-0000-1000-8000-00805f9b34fb",
+            "hex": "8000",
+            "capture": True,
+            "name": "bambu_studio",
+        }
+    ),
+    MappingProxyType(
+        {
+            "uuid": "00002a4d-0000-1000-8000-00805f9b34fb",
+            "hex": "0000",
+            "capture": False,
+            "name": "release",
+        }
+    ),
+)
+
+# Parsed documents per resolved path, tagged with the (mtime_ns, size) they were read at
+_CONFIG_CACHE: Dict[Path, Tuple[int, int, Any]] = {}
+
+# Built profiles per (resolved path, requested name), with the parsed document they came from
+_PROFILE_CACHE: Dict[Tuple[Path, Optional[str]], Tuple[Any, "Profile"]] = {}
+
+
+@dataclass(frozen=True, eq=False)
+class Profile(Mapping[str, Any]):
+    """Read-only, normalized view of one [profiles.<name>] section.
+
+    Built once per config file version by load_profile(). Nested tables are
+    read-only mappings and arrays are tuples, so a cached Profile can be
+    shared safely. It is also a Mapping over the raw section (plus the
+    "_profile_name" key), so dict-style access such as prof["device"]["mac"]
+    keeps working.
+
+    Attributes:
+        name: Resolved profile name
+        device: [device] table (always present)
+        camera: [camera] table (always present, with an rpicam table)
+        events: Trigger event definitions, including hardware defaults
+        triggers: Byte sequences of the events that capture a photo
+        data: The normalized section backing the Mapping interface
+    """
+
+    name: str
+    device: Mapping[str, Any]
+    camera: Mapping[str, Any]
+    events: Tuple[Mapping[str, Any], ...]
+    triggers: frozenset[bytes]
+    data: Mapping[str, Any] = field(repr=False)
+
+    @property
+    def rpicam(self) -> Mapping[str, Any]:
+        """The [camera.rpicam] table."""
+        return self.camera["rpicam"]  # type: ignore[no-any-return]
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert tables to read-only mappings and arrays to tuples.
+
+    Strings (keys, UUIDs, hex signatures) are interned so the same value read
+    from several events or profiles shares one object and compares by identity.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
 
 
 def ensure_config_exists(path: Path = DEFAULT_CONFIG_PATH) -> None:
     """Ensure a config.toml exists; create with defaults if missing.
 
     Creates parent directories automatically and initializes with a minimal
-    "default" profile containing sensible base settings.
+    "default" profile containing sensible base settings. Paths are checked
+    once per process; use forget_ensured() if the file may have been removed.
 
     Args:
         path: Path to config.toml file
@@ -51,38 +198,37 @@ def ensure_config_exists(path: Path = DEFAULT_CONFIG_PATH) -> None:
         >>> ensure_config_exists()
         >>> # ~/.config/bbl-shutter-cam/config.toml now exists
     """
+    # Keyed on the path as given: resolve() would cost more syscalls than it saves
+    if path in _ENSURED:
+        return
     if path.exists():
+        _ENSURED.add(path)
         return
 
     path.parent.mkdir(parents=True, exist_ok=True)
+    output_dir = json.dumps(str(_HOME / "captures" / "default"))
+    _atomic_write_text(path, _DEFAULT_CONFIG_TOML.format(output_dir=output_dir))
+    _ENSURED.add(path)
 
-    cfg = document()
-    cfg["default_profile"] = "default"
-    cfg["profiles"] = document()
-
-    # Minimal default profile
-    cfg["profiles"]["default"] = document()  # type: ignore[index]
-    cfg["profiles"]["default"]["device"] = {  # type: ignore[index]
-        "name": "BBL_SHUTTER",
-        # mac and notify_uuid learned during setup
-    }
-    cfg["profiles"]["default"]["camera"] = {  # type: ignore[index]
-        "output_dir": str(Path.home() / "captures" / "default"),
-        "filename_format": "%Y%m%d_%H%M%S.jpg",
-        "min_interval_sec": 0.5,
-        "rpicam": {
-            "width": 1920,
-            "height": 1080,
-            "nopreview": True,
-        },
-    }
-
-    path.write_text(dumps(cfg))
+
+def forget_ensured(path: Path) -> None:
+    """Make the next ensure_config_exists(path) check the filesystem again.
+
+    Args:
+        path: Path to config.toml file
+    """
+    _ENSURED.discard(path)
 
 
 def load_config(path: Path = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
     """Load and parse the entire TOML configuration file.
 
+    Returns plain dicts (comments and formatting are not preserved); use
+    load_config_editable() when the document will be modified and saved.
+    Parsed documents are cached per path and reused while the file's mtime
+    and size are unchanged. Each call returns its own deep copy, so callers
+    may mutate the result freely.
+
     Args:
         path: Path to config.toml file
 
@@ -98,34 +244,98 @@ def load_config(path: Path = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
         >>> print(list(profiles.keys()))
         ['office', 'workshop']
     """
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
-    return parse(path.read_text())
+    return copy.deepcopy(_cached_document(path)[2])
+
+
+def _cached_document(path: Path) -> Tuple[int, int, Any]:
+    """Return (mtime_ns, size, parsed document) for path, re-parsing only on change.
+
+    The document is shared with the cache and must not be mutated.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+
+    key = path.resolve()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None or cached[:2] != stamp:
+        cached = (*stamp, _load_readonly(path))
+        _CONFIG_CACHE[key] = cached
+    return cached
+
+
+def load_config_editable(path: Path = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
+    """Load the configuration as a tomlkit document for modification.
+
+    Unlike load_config(), the result keeps comments and formatting so that
+    save_config() writes the user's file back with only the intended changes.
+
+    Args:
+        path: Path to config.toml file
+
+    Returns:
+        tomlkit document representing the parsed TOML
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+
+    Example:
+        >>> cfg = load_config_editable()
+        >>> cfg["default_profile"] = "office"
+        >>> save_config(cfg)
+    """
+    from tomlkit import parse
+
+    try:
+        return parse(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
 
 
 def save_config(cfg: Dict[str, Any], path: Path = DEFAULT_CONFIG_PATH) -> None:
     """Write configuration back to disk.
 
-    Creates parent directories if needed. Uses TOML formatting.
+    Creates parent directories if needed. Uses TOML formatting. The file is
+    written to a temporary sibling and renamed over the original, so a crash
+    mid-write never leaves a truncated config behind. Nothing is written when
+    the file already holds exactly this content.
 
     Args:
         cfg: Configuration dictionary to save
         path: Path to write config.toml file to
 
     Example:
-        >>> cfg = load_config()
+        >>> cfg = load_config_editable()
         >>> cfg["profiles"]["new_printer"] = {...}
         >>> save_config(cfg)
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(dumps(cfg))
+    from tomlkit import dumps
+
+    text = dumps(cfg)
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write_text(path, text)
+    _CONFIG_CACHE.pop(path.resolve(), None)
+
 
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Replace path's contents with text via a temporary file and os.replace()."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
 
-def load_profile(path: Path, profile_name: str | None) -> Dict[str, Any]:
+
+def load_profile(path: Path, profile_name: str | None) -> Profile:
     """Load a single named profile from the configuration file.
 
     Resolves default_profile if profile_name is None. Normalizes the returned
-    dict to ensure expected sections (device, camera, camera.rpicam) exist.
+    profile to ensure expected sections (device, camera, camera.rpicam) exist.
+    The result is cached until the config file changes on disk.
 
     Args:
         path: Path to config.toml file
@@ -133,7 +343,7 @@ def load_profile(path: Path, profile_name: str | None) -> Dict[str, Any]:
                      default_profile from config
 
     Returns:
-        Dict: Profile configuration with normalized structure and "_profile_name" key
+        Profile: Read-only profile with normalized structure and "_profile_name" key
 
     Raises:
         FileNotFoundError: If config file doesn't exist
@@ -145,36 +355,50 @@ def load_profile(path: Path, profile_name: str | None) -> Dict[str, Any]:
         ...     "office",
         ... )
         >>> mac = prof["device"]["mac"]
-        >>> width = prof["camera"]["rpicam"]["width"]
+        >>> width = prof.rpicam["width"]
     """
-    cfg = load_config(path)
+    cfg = _cached_document(path)[2]
+    cache_key = (path.resolve(), profile_name)
+    cached = _PROFILE_CACHE.get(cache_key)
+    if cached is not None and cached[0] is cfg:
+        return cached[1]
 
     profiles = cfg.get("profiles")
     if not profiles:
         raise KeyError("No [profiles] section found in config.")
 
-    if profile_name is None:
-        profile_name = cfg.get("default_profile")
-        if not profile_name:
+    name = profile_name
+    if name is None:
+        name = cfg.get("default_profile")
+        if not name:
             raise KeyError("No profile specified and no default_profile set.")
 
-    if profile_name not in profiles:
-        raise KeyError(f"Profile '{profile_name}' not found in config.")
-
-    prof = profiles[profile_name]
+    if name not in profiles:
+        raise KeyError(f"Profile '{name}' not found in config.")
 
-    # Normalize expected sections
-    prof.setdefault("device", {})
-    prof.setdefault("camera", {})
-    prof["camera"].setdefault("rpicam", {})
+    # Normalize expected sections (on a shallow copy; the cached document is shared)
+    raw = dict(profiles[name])
+    raw.setdefault("device", {})
+    raw["camera"] = dict(raw.get("camera", {}))
+    raw["camera"].setdefault("rpicam", {})
 
     # Attach resolved name for convenience
-    prof["_profile_name"] = profile_name
-
-    return prof  # type: ignore[no-any-return]
-
-
-def get_trigger_events(profile: Dict[str, Any]) -> list[Dict[str, Any]]:
+    raw["_profile_name"] = name
+
+    data = _freeze(raw)
+    prof = Profile(
+        name=name,
+        device=data["device"],
+        camera=data["camera"],
+        events=_freeze(get_trigger_events(raw)),
+        triggers=get_event_trigger_bytes(raw),
+        data=data,
+    )
+    _PROFILE_CACHE[cache_key] = (cfg, prof)
+    return prof
+
+
+def get_trigger_events(profile: Mapping[str, Any]) -> Sequence[Mapping[str, Any]]:
     """Get trigger event definitions from a profile.
 
     Retrieves configured trigger signals that should cause photo capture.
@@ -185,7 +409,7 @@ def get_trigger_events(profile: Dict[str, Any]) -> list[Dict[str, Any]]:
         profile: Profile dict (from load_profile())
 
     Returns:
-        List of event dicts, each containing:
+        Sequence of event mappings (read-only for the defaults), each containing:
             - hex: Hex string (e.g., "4000")
             - capture: Bool, whether to capture on this event
             - name: Optional event name (e.g., "manual_button")
@@ -203,42 +427,24 @@ def get_trigger_events(profile: Dict[str, Any]) -> list[Dict[str, Any]]:
 
     # If no events configured, return hardware defaults for compatibility
     if not events:
-        # Default trigger signals for BBL_SHUTTER / Bambu devices
-        return [
-            {
-                "uuid": "00002a4d-0000-1000-8000-00805f9b34fb",
-                "hex": "4000",
-                "capture": True,
-                "name": "manual_button",
-            },
-            {
-                "uuid": "00002a4d-0000-1000-8000-00805f9b34fb",
-                "hex": "8000",
-                "capture": True,
-                "name": "bambu_studio",
-            },
-            {
-                "uuid": "00002a4d-0000-1000-8000-00805f9b34fb",
-                "hex": "0000",
-                "capture": False,
-                "name": "release",
-            },
-        ]
+        return _DEFAULT_EVENTS
 
     return events  # type: ignore[no-any-return]
 
 
-def get_event_trigger_bytes(profile: Dict[str, Any]) -> list[bytes]:
+def get_event_trigger_bytes(profile: Mapping[str, Any]) -> frozenset[bytes]:
     """Get all configured trigger byte sequences that should capture photos.
 
-    Extracts and converts hex-string trigger events to bytes. Skips any events
-    that don't have capture=True or have invalid hex format.
+    Extracts and converts hex-string trigger events to bytes. Skips (with a
+    warning) events that don't have capture=True or have invalid hex format.
+    A Profile already carries the decoded set from load time, so this is an
+    attribute read; plain dicts are decoded once per distinct event list.
 
     Args:
-        profile: Profile dict (from load_profile())
+        profile: Profile (from load_profile()) or equivalent dict
 
     Returns:
-        List of bytes objects (e.g., [b"@\x00", b"\x80\x00"])
+        frozenset of bytes objects (e.g., frozenset({b"@\x00", b"\x80\x00"}))
 
     Example:
         >>> prof = load_profile(path, "office")
@@ -246,18 +452,28 @@ def get_event_trigger_bytes(profile: Dict[str, Any]) -> list[bytes]:
         >>> if notification_data in triggers:
         ...     capture_photo()
     """
+    if isinstance(profile, Profile):
+        return profile.triggers
     events = get_trigger_events(profile)
-    triggers = []
-    for event in events:
-        if event.get("capture", False):
-            try:
-                hex_str = event.get("hex", "")
-                # Convert hex string like "4000" to bytes
-                trigger_bytes = bytes.fromhex(hex_str)
-                triggers.append(trigger_bytes)
-            except ValueError:
-                continue
-    return triggers
+    key = tuple((str(e.get("hex", "")), bool(e.get("capture", False))) for e in events)
+    return _triggers_for(key)
+
+
+@functools.lru_cache(maxsize=8)
+def _triggers_for(events: Tuple[Tuple[str, bool], ...]) -> frozenset[bytes]:
+    """Convert (hex, capture) pairs into the set of capturing trigger bytes."""
+    triggers = set()
+    for hex_str, capture in events:
+        if not capture:
+            continue
+        # Spaces between bytes ("40 00") are allowed, as with fromhex(); case is irrelevant
+        digits = "".join(hex_str.split())
+        if not _HEX_RE.fullmatch(digits):
+            LOG.warning(f"Ignoring trigger event with invalid hex {hex_str.strip()!r}")
+            continue
+        # Convert hex string like "4000" to bytes
+        triggers.add(bytes.fromhex(digits))
+    return frozenset(triggers)
 
 
 def update_profile_device_fields(
@@ -265,6 +481,7 @@ def update_profile_device_fields(
     profile_name: str,
     mac: str,
     notify_uuid: str,
+    cfg: Optional[Dict[str, Any]] = None,
 ) -> None:
     """Update or create device pairing information for a profile.
 
@@ -276,6 +493,8 @@ def update_profile_device_fields(
         profile_name: Name of profile to update (created if new)
         mac: Device MAC address (e.g., "AA:BB:CC:DD:EE:FF")
         notify_uuid: UUID of the characteristic that sends shutter signals
+        cfg: Document from load_config_editable() to update instead of
+             re-reading the file (it is modified in place)
 
     Example:
         >>> update_profile_device_fields(
@@ -286,7 +505,10 @@ def update_profile_device_fields(
         ... )
         >>> # Now ~/.config/bbl-shutter-cam/config.toml has these settings
     """
-    cfg = load_config(path)
+    from tomlkit import document
+
+    if cfg is None:
+        cfg = load_config_editable(path)
 
     profiles = cfg.setdefault("profiles", document())
     prof = profiles.setdefault(profile_name, document())
@@ -13,29 +13,44 @@ core photo capture functionality.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import subprocess
-from typing import Any, Dict, Optional, Tuple
+import sys
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
 
 from bleak import BleakScanner
 
 from . import ble
-from .camera import build_rpicam_still_cmd, camera_config_from_profile, make_outfile
+from .camera import (
+    CameraSession,
+    build_rpicam_still_cmd,
+    camera_config_from_profile,
+    make_outfile,
+    open_camera_session,
+)
 from .config import update_profile_device_fields
-from .util import LOG
+from .util import LOG, LogLevel
 
 # Default press bytes for notify UUID learning.
 PRESS_BYTES = b"\x40\x00"  # Manual button press
 
+# Right-aligned decimal column for each byte value, for debug_signals output
+_DEC = tuple(f"{i:3d}" for i in range(256))
+
 
 async def scan(name_filter: Optional[str] = None, timeout: float = 8.0):
     """Scan for nearby BLE devices.
 
-    Performs a BLE scan and optionally filters results by device name.
+    Performs a BLE scan and optionally filters results by device name. With a
+    name filter the scan stops as soon as a matching device is seen instead of
+    running for the full timeout.
 
     Args:
         name_filter: Optional device name to filter by (exact match); if None,
                     returns all discovered devices
-        timeout: Scan duration in seconds
+        timeout: Maximum scan duration in seconds
 
     Returns:
         List of BleakDevice objects discovered
@@ -45,20 +60,32 @@ async def scan(name_filter: Optional[str] = None, timeout: float = 8.0):
         >>> for dev in devices:
         ...     print(f"{dev.name} ({dev.address})")
     """
-    LOG.debug(f"BLE scan start: timeout={timeout}s filter={name_filter!r}")
-    devices = await BleakScanner.discover(timeout=timeout)
-
+    LOG.debug("BLE scan start: timeout=%ss filter=%r", timeout, name_filter)
     if not name_filter:
-        LOG.debug(f"BLE scan done: {len(devices)} device(s) found")
+        devices = await BleakScanner.discover(timeout=timeout)
+        LOG.debug("BLE scan done: %d device(s) found", len(devices))
         return devices
 
-    hits = []
-    for d in devices:
-        if (d.name or "").strip() == name_filter:
-            hits.append(d)
+    hits: Dict[str, Any] = {}
+    found = asyncio.Event()
+
+    def _detected(device: Any, adv: Any) -> None:
+        # The name can arrive in the advertisement before bleak caches it on the device
+        if (device.name or adv.local_name or "").strip() == name_filter:
+            hits.setdefault(device.address, device)
+            found.set()
 
-    LOG.debug(f"BLE scan done: {len(hits)} matching device(s) found")
-    return hits
+    scanner = BleakScanner(detection_callback=_detected)
+    await scanner.start()
+    try:
+        await asyncio.wait_for(found.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        await scanner.stop()
+
+    LOG.debug("BLE scan done: %d matching device(s) found", len(hits))
+    return list(hits.values())
 
 
 def find_paired_device(name: str) -> Optional[Dict[str, str]]:
@@ -126,26 +153,22 @@ async def learn_notify_uuid(mac: str, press_timeout: float = 30.0, verbose: bool
     try:
         LOG.debug("Connected. Discovering NOTIFY characteristics…")
         notify_uuids = await ble.list_notify_characteristics(client)
-        LOG.debug(f"Notify characteristics discovered: {len(notify_uuids)}")
+        LOG.debug("Notify characteristics discovered: %d", len(notify_uuids))
 
         if not notify_uuids:
             raise RuntimeError("No notify characteristics found to learn from.")
 
-        loop = asyncio.get_event_loop()
-        found: asyncio.Future[str] = loop.create_future()
-
-        def cb_factory(uuid: str):
-            def _cb(_sender: int, data: bytearray):
-                b = bytes(data)
-                if verbose:
-                    print(f"[notify:{uuid}] {b.hex()}")
-                if b == PRESS_BYTES and not found.done():
-                    found.set_result(uuid)
+        found: asyncio.Future[str] = asyncio.get_running_loop().create_future()
 
-            return _cb
+        # One callback for every characteristic; the sender says which one fired
+        def on_notify(sender: Any, data: bytearray) -> None:
+            if verbose:
+                print(f"[notify:{sender.uuid}] {data.hex()}")
+            if data == PRESS_BYTES and not found.done():
+                found.set_result(sender.uuid)
 
-        active = await ble.start_notify_best_effort(client, notify_uuids, cb_factory)
-        LOG.debug(f"Subscribed to {len(active)}/{len(notify_uuids)} notify characteristic(s)")
+        active = await ble.start_notify_best_effort(client, notify_uuids, lambda _uuid: on_notify)
+        LOG.debug("Subscribed to %d/%d notify characteristic(s)", len(active), len(notify_uuids))
 
         if not active:
             raise RuntimeError("Could not subscribe to any notify characteristics.")
@@ -216,16 +239,20 @@ async def setup_profile(
 
 
 async def run_profile(
-    profile: Dict[str, Any],
+    profile: Mapping[str, Any],
     dry_run: bool = False,
     verbose: bool = False,
-    reconnect_delay: float = 2.0,
+    reconnect_delay: Optional[float] = None,
+    reconnect_min: float = 1.0,
+    reconnect_max: float = 64.0,
 ) -> None:
     """Main event loop: listen for shutter signals and capture photos.
 
     Connects to the BLE device from the profile and listens for configured
-    trigger events. On each trigger, captures a photo using rpicam-still with
-    settings from the profile. Automatically reconnects on connection loss.
+    trigger events. On each trigger, captures a photo with settings from the
+    profile: through a persistent CameraSession when Picamera2 is installed
+    (the camera is started once, up front), otherwise by running rpicam-still.
+    Automatically reconnects on connection loss.
 
     Args:
         profile: Profile dict (from load_profile()) containing:
@@ -235,7 +262,9 @@ async def run_profile(
             - camera: Camera settings for rpicam-still
         dry_run: If True, log triggers but don't actually capture photos
         verbose: Print BLE notification payloads as received
-        reconnect_delay: Seconds between reconnection attempts
+        reconnect_delay: Deprecated; if set, pins reconnect_min and reconnect_max
+        reconnect_min: Seconds before the first reconnection retry
+        reconnect_max: Cap for the exponential reconnection backoff, in seconds
 
     Raises:
         SystemExit: If profile is missing required fields (MAC, notify_uuid)
@@ -249,7 +278,7 @@ async def run_profile(
         >>> await run_profile(prof, dry_run=False, verbose=True)
         >>> # Listens for shutter signals and captures photos...
     """
-    from .config import get_trigger_events
+    from .config import get_event_trigger_bytes, get_trigger_events
 
     dev = profile.get("device", {}) or {}
     mac = dev.get("mac")
@@ -262,21 +291,26 @@ async def run_profile(
     if not notify_uuid:
         raise SystemExit("[!] Profile has no device.notify_uuid. Run setup to learn it.")
 
+    if reconnect_delay is not None:
+        reconnect_min = reconnect_max = reconnect_delay
+
     cam_cfg = camera_config_from_profile(profile)
-    min_interval = cam_cfg.min_interval_sec
-    last_press = 0.0
-
-    # Load trigger events from config
-    trigger_events = get_trigger_events(profile)
-    trigger_map = {}  # Maps bytes -> event info
-    for event in trigger_events:
-        if event.get("capture", False):
-            try:
-                hex_str = event.get("hex", "")
-                trigger_bytes = bytes.fromhex(hex_str)
-                trigger_map[trigger_bytes] = event
-            except ValueError:
-                pass
+    # Debounce in integer nanoseconds on the monotonic clock
+    min_interval_ns = int(cam_cfg.min_interval_sec * 1e9)
+    last_press_ns = -min_interval_ns  # the first press always passes
+
+    # Load trigger events from config: payload -> (event name, hex for logging).
+    # Hex strings were validated when the profile was loaded, so only events
+    # whose bytes made it into the trigger set are kept here.
+    valid_hex = {b.hex() for b in get_event_trigger_bytes(profile)}
+    trigger_map: Dict[bytes, Tuple[str, str]] = {}
+    for event in get_trigger_events(profile):
+        hex_str = event.get("hex", "").strip()
+        canonical = "".join(hex_str.split()).lower()
+        if event.get("capture", False) and canonical in valid_hex:
+            trigger_map[bytes.fromhex(canonical)] = (event.get("name", hex_str), hex_str)
+    if LOG.enabled_for(LogLevel.DEBUG):
+        LOG.debug("Trigger map: %s", {k.hex(): v[0] for k, v in trigger_map.items()})
 
     prof_name = profile.get("_profile_name", "unknown")
     LOG.info(f"Profile: {prof_name}")
@@ -287,62 +321,190 @@ async def run_profile(
     if dry_run:
         LOG.warning("Dry-run enabled: no photos will be taken.")
 
-    while True:
-        client = None
-        try:
-            LOG.info("Connecting…")
-            client = await ble.connect_with_retry(mac, reconnect_delay=reconnect_delay)
-            LOG.info("Connected; subscribing to notifications…")
-
-            def on_notify(_sender: int, data: bytearray):
-                nonlocal last_press
-                b = bytes(data)
-
-                if verbose:
-                    print(f"[notify] {b.hex()}")
-
-                # Check if this is a configured trigger event
-                if b in trigger_map:
-                    now = asyncio.get_event_loop().time()
-                    if now - last_press < min_interval:
-                        LOG.debug("Debounced press (too soon).")
-                        return
-                    last_press = now
-
-                    event = trigger_map[b]
-                    event_name = event.get("name", b.hex())
-                    LOG.info(f"SHUTTER PRESS ({event_name}) {b.hex()}")
-                    if dry_run:
-                        return
-
-                    outfile = make_outfile(cam_cfg)
-                    cmd = build_rpicam_still_cmd(cam_cfg, outfile)
-                    LOG.debug(f"Capture cmd: {' '.join(cmd)}")
+    # Start the camera once so a trigger only pays for encoding one frame. This
+    # is None (rpicam-still per capture) unless the session can apply every
+    # camera setting in the profile exactly as rpicam-still would.
+    session = None if dry_run else open_camera_session(cam_cfg)
+    if session is not None:
+        LOG.info("Camera: persistent Picamera2 session")
+    # One capture at a time: a second rpicam-still would find the camera busy.
+    # Presses that arrive mid-capture collapse into a single pending slot, and
+    # the latest press wins it.
+    press_q: asyncio.Queue[str] = asyncio.Queue(maxsize=1)
+
+    # Bound once: the notification callback reads these from its closure instead
+    # of looking up module globals and attributes on every event
+    lookup = trigger_map.get
+    trigger_lengths = frozenset(map(len, trigger_map))
+    loop = asyncio.get_running_loop()
+    log_info, log_debug = LOG.info, LOG.debug
+    new_outfile = make_outfile
+    queue_full, queue_get, queue_put = press_q.full, press_q.get_nowait, press_q.put_nowait
+    queue_done = press_q.task_done
+
+    # Only the output path differs between captures: split the command around
+    # it once so each press just splices the new path in
+    base_cmd = build_rpicam_still_cmd(cam_cfg, "")
+    out_idx = base_cmd.index("-o") + 1
+    cmd_prefix, cmd_suffix = base_cmd[:out_idx], base_cmd[out_idx + 1 :]
+
+    async def capture_one(outfile: str) -> None:
+        if session is not None:
+            await _capture_in_session(session, outfile)
+            return
+        cmd = [*cmd_prefix, outfile, *cmd_suffix]
+        if LOG.enabled_for(LogLevel.DEBUG):
+            LOG.debug("Capture cmd: %s", " ".join(cmd))
+        await _capture(cmd, outfile)
+
+    # Names read on every notification are keyword-only defaults, so the
+    # callback sees them as plain locals rather than closure cells
+    def on_notify(
+        _sender: Any,
+        data: bytearray,
+        *,
+        _verbose: bool = verbose,
+        _lengths: frozenset[int] = trigger_lengths,
+        _lookup: Callable[[bytes], Optional[Tuple[str, str]]] = lookup,
+        _clock_ns: Callable[[], int] = time.monotonic_ns,
+        _min_interval_ns: int = min_interval_ns,
+    ) -> None:
+        nonlocal last_press_ns
+
+        if _verbose:
+            print(f"[notify] {data.hex()}")
+
+        # Check if this is a configured trigger event; payloads of a length no
+        # trigger has are dropped before copying and hashing them
+        if len(data) not in _lengths:
+            return
+        info = _lookup(bytes(data))
+        if info is None:
+            return
+
+        now_ns = _clock_ns()
+        if now_ns - last_press_ns < _min_interval_ns:
+            log_debug("Debounced press (too soon).")
+            return
+        last_press_ns = now_ns
 
+        event_name, hex_str = info
+        log_info("SHUTTER PRESS (%s) %s", event_name, hex_str)
+        if dry_run:
+            return
+
+        # Hand off to the capture worker so the callback returns immediately
+        if queue_full():
+            log_debug("Capture in progress; replacing queued %s", queue_get())
+            queue_done()  # the replaced press will never be captured
+        queue_put(new_outfile(cam_cfg))
+
+    worker = None if dry_run else loop.create_task(_capture_worker(press_q, capture_one))
+
+    try:
+        while True:
+            client = None
+            try:
+                LOG.info("Connecting…")
+                # Set by bleak when the link drops, so the loop sleeps until then
+                disconnected = asyncio.Event()
+
+                def on_disconnect(_client: Any, ev: asyncio.Event = disconnected) -> None:
+                    loop.call_soon_threadsafe(ev.set)
+
+                client = await ble.connect_with_retry(
+                    mac,
+                    reconnect_delay=reconnect_min,
+                    disconnected_callback=on_disconnect,
+                    max_delay=reconnect_max,
+                )
+                LOG.info("Connected; subscribing to notifications…")
+
+                await client.start_notify(notify_uuid, on_notify)
+                LOG.info("Listening… (Ctrl+C to quit)")
+
+                if client.is_connected:
+                    await disconnected.wait()
+
+                LOG.warning("Disconnected; will reconnect…")
+            except KeyboardInterrupt:
+                LOG.info("Exiting.")
+                await press_q.join()
+                return
+            except Exception as e:
+                LOG.error(f"{e.__class__.__name__}: {e}")
+                # A stale cached attribute tree can make start_notify fail
+                ble.invalidate_cache(mac)
+            finally:
+                if client:
                     try:
-                        subprocess.run(cmd, check=True)
-                        LOG.info(f"Captured: {outfile}")
-                    except subprocess.CalledProcessError as e:
-                        LOG.error(f"rpicam-still failed: {e}")
+                        await client.disconnect()
+                    except Exception:
+                        pass
+    finally:
+        if worker is not None:
+            worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+        if session is not None:
+            session.close()
 
-            await client.start_notify(notify_uuid, on_notify)  # type: ignore[arg-type]
-            LOG.info("Listening… (Ctrl+C to quit)")
 
-            while client.is_connected:
-                await asyncio.sleep(0.5)
+async def _capture_worker(
+    queue: asyncio.Queue[str], capture_one: Callable[[str], Awaitable[None]]
+) -> None:
+    """Take output paths off the press queue and capture them one at a time.
 
-            LOG.warning("Disconnected; will reconnect…")
-        except KeyboardInterrupt:
-            LOG.info("Exiting.")
-            return
+    Args:
+        queue: Pending captures, filled by the notification callback
+        capture_one: Coroutine function that captures a photo to the given path
+    """
+    while True:
+        outfile = await queue.get()
+        try:
+            await capture_one(outfile)
         except Exception as e:
-            LOG.error(f"{e.__class__.__name__}: {e}")
+            LOG.error(f"Capture failed: {e.__class__.__name__}: {e}")
         finally:
-            if client:
-                try:
-                    await client.disconnect()
-                except Exception:
-                    pass
+            queue.task_done()
+
+
+async def _capture(cmd: List[str], outfile: str) -> None:
+    """Run one rpicam-still capture as an asyncio subprocess and log the result.
+
+    Args:
+        cmd: rpicam-still command line (from build_rpicam_still_cmd())
+        outfile: Path the capture is written to, for logging
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+        )
+    except OSError as e:
+        LOG.error(f"rpicam-still failed: {e}")
+        return
+    _, stderr = await proc.communicate()
+
+    if proc.returncode:
+        detail = stderr.decode(errors="replace").strip()
+        LOG.error(f"rpicam-still failed (exit {proc.returncode}): {detail}")
+    else:
+        LOG.info(f"Captured: {outfile}")
+
+
+async def _capture_in_session(session: CameraSession, outfile: str) -> None:
+    """Capture one photo through a CameraSession on a worker thread and log the result.
+
+    Args:
+        session: Open camera session (from open_camera_session())
+        outfile: Output file path
+    """
+    try:
+        await asyncio.to_thread(session.capture, outfile)
+    except Exception as e:
+        LOG.error(f"Capture failed: {e.__class__.__name__}: {e}")
+        return
+    LOG.info(f"Captured: {outfile}")
 
 
 async def debug_signals(
@@ -351,6 +513,7 @@ async def debug_signals(
     mac: str,
     duration: float = 120.0,
     update_config: bool = False,
+    show_dec: bool = True,
 ) -> None:
     """Listen for all BLE signals and log them for analysis.
 
@@ -367,8 +530,9 @@ async def debug_signals(
         mac: Device MAC address to connect to
         duration: Listen duration in seconds (0 = listen indefinitely)
         update_config: If True, automatically save discovered signals to config
+        show_dec: If False, omit the DEC line from each signal's output
 
-    Output Format (for each signal received):
+    Output Format (for each signal received; written once per drained batch):
         [HH:MM:SS.mmm] <UUID>
                    HEX: <uppercase hex string>
                    DEC: <space-separated decimal values>
@@ -392,7 +556,13 @@ async def debug_signals(
     from datetime import datetime
 
     LOG.info(f"Connecting to {mac}…")
-    client = await ble.connect_with_retry(mac)
+    loop = asyncio.get_running_loop()
+    disconnected = asyncio.Event()
+
+    def on_disconnect(_client: Any) -> None:
+        loop.call_soon_threadsafe(disconnected.set)
+
+    client = await ble.connect_with_retry(mac, disconnected_callback=on_disconnect)
 
     try:
         LOG.info("Connected. Discovering NOTIFY characteristics…")
@@ -406,37 +576,47 @@ async def debug_signals(
             LOG.error("No NOTIFY characteristics found.")
             return
 
-        # Track signals by UUID
-        seen_data: dict[str, list[bytes]] = {}
-
-        def make_callback(uuid: str):
-            def callback(_sender: int, data: bytearray) -> None:
-                b = bytes(data)
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-
-                if uuid not in seen_data:
-                    seen_data[uuid] = []
-                seen_data[uuid].append(b)
-
-                hex_str = b.hex().upper()
-                dec_values = " ".join(f"{byte:3d}" for byte in b)
-                print(f"[{timestamp}] {uuid}")
-                print(f"           HEX: {hex_str}")
-                print(f"           DEC: {dec_values}")
-                print(f"           LEN: {len(b)} bytes")
-                print()
-
-            return callback
-
-        # Subscribe to all
+        # Count each distinct payload per UUID, keyed by its uppercase hex
+        seen_data: Dict[str, Counter[str]] = {}
+        # Uppercase hex per distinct payload, formatted on first sight only
+        hex_of: Dict[bytes, str] = {}
+
+        def process_batch(batch: List[Tuple[str, bytes]]) -> None:
+            if not batch:
+                return
+            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+            out: List[str] = []
+            for uuid, b in batch:
+                hex_str = hex_of.get(b)
+                if hex_str is None:
+                    hex_str = hex_of[b] = b.hex().upper()
+                counts = seen_data.get(uuid)
+                if counts is None:
+                    counts = seen_data[uuid] = Counter()
+                counts[hex_str] += 1
+
+                out.append(f"[{timestamp}] {uuid}\n           HEX: {hex_str}\n")
+                if show_dec:
+                    out.append(f"           DEC: {' '.join(map(_DEC.__getitem__, b))}\n")
+                out.append(f"           LEN: {len(b)} bytes\n\n")
+            # One write per batch instead of several print() calls per signal
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
+
+        # Notifications are buffered by the callbacks and printed by one consumer task
+        ring = ble.NotifyRing()
+
+        async def consume() -> None:
+            while True:
+                process_batch(await ring.drain())
+
+        consumer = asyncio.ensure_future(consume())
+
+        # Subscribe to all at once rather than one GATT round-trip after another
         LOG.info("Subscribing to all NOTIFY characteristics…")
-        active = []
-        for uuid in notify_uuids:
-            try:
-                await client.start_notify(uuid, make_callback(uuid))
-                active.append(uuid)
-            except Exception as e:
-                LOG.warning(f"Failed to subscribe to {uuid}: {e}")
+        active = await ble.start_notify_best_effort(
+            client, notify_uuids, lambda _uuid: ring.callback, warn_failures=True
+        )
 
         LOG.info(f"Successfully subscribed to {len(active)}/{len(notify_uuids)} characteristics")
         print()
@@ -445,32 +625,36 @@ async def debug_signals(
             print(f"Listening for {int(duration)} seconds…")
             print("(Trigger your device now to see signals)")
             print()
-            await asyncio.sleep(duration)
+            # Stop at the deadline or as soon as the link drops, whichever is first
+            try:
+                if client.is_connected:
+                    await asyncio.wait_for(disconnected.wait(), timeout=duration)
+                LOG.warning("Device disconnected; ending capture early.")
+            except asyncio.TimeoutError:
+                pass
         else:
             print("Listening indefinitely… Press Ctrl+C to exit")
             print()
             try:
-                while client.is_connected:
-                    await asyncio.sleep(1)
+                if client.is_connected:
+                    await disconnected.wait()
             except (KeyboardInterrupt, asyncio.CancelledError):
                 print("\nStopping capture…")
 
+        consumer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await consumer
+        # Report whatever arrived after the consumer's last drain
+        process_batch(ring.pop_all())
+
         # Print summary
         print("\n" + "=" * 60)
         print("SIGNAL SUMMARY")
         print("=" * 60)
         for uuid in sorted(seen_data.keys()):
-            signals = seen_data[uuid]
-            unique_signals = {}
-            for sig in signals:
-                hex_sig = sig.hex().upper()
-                if hex_sig not in unique_signals:
-                    unique_signals[hex_sig] = 0
-                unique_signals[hex_sig] += 1
-
             print(f"\n{uuid}:")
-            for hex_sig, count in sorted(unique_signals.items(), key=lambda x: -x[1]):
-                print(f"  {hex_sig:20s} (received {count} time(s))")
+            for sig, count in seen_data[uuid].most_common():
+                print(f"  {sig:20s} (received {count} time(s))")
 
         # Update config if requested
         if update_config and seen_data:
@@ -486,7 +670,7 @@ async def debug_signals(
 def _update_config_with_signals(
     config_path,
     profile_name: str,
-    seen_data: Dict[str, list],
+    seen_data: Mapping[str, Counter[str]],
 ) -> None:
     """Update profile configuration with discovered BLE signals.
 
@@ -497,7 +681,7 @@ def _update_config_with_signals(
     Args:
         config_path: Path to config.toml file
         profile_name: Profile name to update
-        seen_data: Dict mapping UUID -> list of signal bytes objects
+        seen_data: Dict mapping UUID -> Counter of uppercase hex signals
                   (typically from debug_signals())
 
     Notes:
@@ -509,10 +693,10 @@ def _update_config_with_signals(
     Raises:
         No exceptions; errors are logged and printed to user
     """
-    from .config import load_config, save_config
+    from .config import load_config_editable, save_config
 
     try:
-        cfg = load_config(config_path)
+        cfg = load_config_editable(config_path)
         prof = cfg.get("profiles", {}).get(profile_name)
 
         if not prof:
@@ -530,15 +714,7 @@ def _update_config_with_signals(
         # Build event list from discovered signals
         events = []
         for uuid in sorted(seen_data.keys()):
-            signals = seen_data[uuid]
-            unique_signals = {}
-            for sig in signals:
-                hex_sig = sig.hex().upper()
-                if hex_sig not in unique_signals:
-                    unique_signals[hex_sig] = 0
-                unique_signals[hex_sig] += 1
-
-            for hex_sig, count in sorted(unique_signals.items(), key=lambda x: -x[1]):
+            for hex_sig, count in seen_data[uuid].most_common():
                 # Skip release signals by default
                 should_capture = hex_sig != "0000"
                 events.append(
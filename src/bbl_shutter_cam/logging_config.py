@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 
 class ColorFormatter(logging.Formatter):
@@ -23,10 +23,26 @@ class ColorFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Colored level names are composed once instead of on every record
+        self._colored = {
+            lvl: f"{color}{logging.getLevelName(lvl)}{self.RESET}"
+            for lvl, color in self.COLORS.items()
+        }
+
     def format(self, record: logging.LogRecord) -> str:
-        if record.levelno in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelno]}{record.levelname}{self.RESET}"
-        return super().format(record)
+        colored = self._colored.get(record.levelno)
+        if colored is None:
+            return super().format(record)
+        # The record is shared with other handlers (e.g. the file log), so the
+        # plain level name is restored once this formatter is done with it
+        original = record.levelname
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = original
 
 
 def setup_logging(
@@ -44,6 +60,9 @@ def setup_logging(
     Returns:
         Configured logger instance
 
+    Raises:
+        ValueError: If level is not a known logging level name
+
     Examples:
         # Development with color
         logger = setup_logging("DEBUG", use_color=True)
@@ -54,8 +73,12 @@ def setup_logging(
         # Both stdout and file
         setup_logging("INFO", log_file="~/.log/app.log", use_color=True)
     """
+    level_num = getattr(logging, level.upper(), None)
+    if not isinstance(level_num, int):
+        raise ValueError(f"Invalid log level: {level!r}")
+
     logger = logging.getLogger("bbl_shutter_cam")
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(level_num)
 
     # Remove existing handlers to avoid duplicates
     for handler in logger.handlers[:]:
@@ -63,7 +86,7 @@ def setup_logging(
 
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, level.upper()))
+    console_handler.setLevel(level_num)
 
     if use_color:
         formatter = ColorFormatter(fmt="%(levelname)s | %(name)s | %(message)s")
@@ -82,7 +105,7 @@ def setup_logging(
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
         file_handler = logging.FileHandler(log_path, mode="a")
-        file_handler.setLevel(getattr(logging, level.upper()))
+        file_handler.setLevel(level_num)
 
         file_formatter = logging.Formatter(
             fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
@@ -14,14 +14,46 @@ making it suitable for SSH/headless operation.
 from __future__ import annotations
 
 import subprocess
-from dataclasses import replace
-from datetime import datetime
+import sys
+import time
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional
-
-from .camera import build_rpicam_still_cmd, camera_config_from_profile
-from .config import load_config, load_profile, save_config
-from .util import LOG
+from typing import Callable, Dict, Optional, Tuple
+
+from .camera import (
+    CameraConfig,
+    CameraSession,
+    build_rpicam_still_cmd,
+    camera_config_from_profile,
+    open_camera_session,
+)
+from .config import load_config_editable, load_profile, save_config
+from .util import LOG, LogLevel
+
+
+# CameraConfig fields the tuning menu can change, in the order they are written to config.toml
+_TUNABLE_FIELDS = (
+    "width",
+    "height",
+    "rotation",
+    "hflip",
+    "vflip",
+    "awb",
+    "ev",
+    "denoise",
+    "sharpness",
+    "shutter",
+    "gain",
+    "awbgains",
+    "saturation",
+    "contrast",
+    "brightness",
+    "metering",
+    "autofocus_mode",
+    "lens_position",
+    "quality",
+    "timeout",
+)
 
 
 class TuningSession:
@@ -38,6 +70,11 @@ class TuningSession:
         original_config: Original camera config for rollback
         test_counter: Counter for test photo numbering
         test_dir: Directory for test photos
+
+    Test photos go through a persistent CameraSession when Picamera2 is
+    installed. The camera stays open across photos taken with the same
+    settings and is restarted only after a setting changes; call close()
+    when the session ends.
     """
 
     def __init__(self, config_path: Path, profile_name: str):
@@ -53,6 +90,8 @@ class TuningSession:
         self.cam_config = camera_config_from_profile(self.profile)
         self.original_config = self.cam_config
         self.test_counter = 0
+        self._camera: Optional[CameraSession] = None
+        self._camera_cfg: Optional[CameraConfig] = None
 
         # Create test photo directory
         self.test_dir = Path(self.cam_config.output_dir).expanduser() / "tune"
@@ -73,15 +112,25 @@ class TuningSession:
             Path to captured photo, or None if capture failed
         """
         self.test_counter += 1
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         filename = f"tune_{self.test_counter:03d}_{timestamp}.jpg"
         outfile = str(self.test_dir / filename)
 
+        camera = self._camera_session()
+        if camera is not None:
+            try:
+                camera.capture(outfile)
+                return outfile
+            except Exception as e:
+                LOG.error(f"Capture failed: {e.__class__.__name__}: {e}")
+                return None
+
         cmd = build_rpicam_still_cmd(self.cam_config, outfile)
-        LOG.debug(f"Capture cmd: {' '.join(cmd)}")
+        if LOG.enabled_for(LogLevel.DEBUG):
+            LOG.debug("Capture cmd: %s", " ".join(cmd))
 
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             return outfile
         except subprocess.CalledProcessError as e:
             LOG.error(f"Capture failed: {e}")
@@ -89,9 +138,32 @@ class TuningSession:
                 LOG.error(f"stderr: {e.stderr.decode()}")
             return None
 
+    def _camera_session(self) -> Optional[CameraSession]:
+        """Return a camera session for the current settings, reopening it if they changed.
+
+        Returns:
+            Open CameraSession, or None to capture with rpicam-still (including
+            whenever the session cannot apply a setting such as denoise, so test
+            photos always show what the saved profile will produce)
+        """
+        if self._camera_cfg == self.cam_config:
+            return self._camera
+        # Release the camera first: a new session or rpicam-still needs it
+        self.close()
+        self._camera = open_camera_session(self.cam_config)
+        self._camera_cfg = self.cam_config
+        return self._camera
+
+    def close(self) -> None:
+        """Release the camera if a persistent session is open."""
+        if self._camera is not None:
+            self._camera.close()
+        self._camera = None
+        self._camera_cfg = None
+
     def save_to_profile(self) -> None:
         """Save current camera settings to profile configuration."""
-        cfg = load_config(self.config_path)
+        cfg = load_config_editable(self.config_path)
 
         # Navigate to profile's rpicam settings
         prof = cfg.get("profiles", {}).get(self.profile_name)
@@ -105,34 +177,14 @@ class TuningSession:
 
         rpicam = prof["camera"]["rpicam"]
 
-        # Update all tunable settings
-        tunable_fields = [
-            "width",
-            "height",
-            "rotation",
-            "hflip",
-            "vflip",
-            "awb",
-            "ev",
-            "denoise",
-            "sharpness",
-            "shutter",
-            "gain",
-            "awbgains",
-            "saturation",
-            "contrast",
-            "brightness",
-            "metering",
-            "autofocus_mode",
-            "lens_position",
-            "quality",
-            "timeout",
-        ]
-
-        for field in tunable_fields:
-            value = getattr(self.cam_config, field)
-            if value is not None:
-                rpicam[field] = value
+        cam = self.cam_config
+        rpicam.update(
+            {
+                field: value
+                for field in _TUNABLE_FIELDS
+                if (value := getattr(cam, field)) is not None
+            }
+        )
 
         save_config(cfg, self.config_path)
         LOG.info(f"Saved settings to profile '{self.profile_name}'")
@@ -144,59 +196,78 @@ class TuningSession:
 
     def show_current_settings(self) -> None:
         """Display current camera settings."""
-        print(f"\n{'='*60}")
-        print(f"Camera Settings: {self.profile_name}")
-        print(f"{'='*60}")
-        print(f"Test photos: {self.test_dir}")
-        print(f"Photos taken: {self.test_counter}")
-        print()
-
-        print("RESOLUTION & ORIENTATION:")
-        print(f"  Resolution: {self.cam_config.width}x{self.cam_config.height}")
-        print(
-            f"  Rotation:   {self.cam_config.rotation if self.cam_config.rotation is not None else 'default (0)'}"
-        )
-        print(f"  H-Flip:     {self.cam_config.hflip}")
-        print(f"  V-Flip:     {self.cam_config.vflip}")
-        print()
-
-        print("FOCUS:")
-        print(f"  AF Mode:    {self.cam_config.autofocus_mode or 'default'}")
-        print(
-            f"  Lens Pos:   {self.cam_config.lens_position if self.cam_config.lens_position is not None else 'auto'}"
-        )
-        print()
-
-        print("EXPOSURE & COLOR:")
-        print(f"  EV:         {self.cam_config.ev if self.cam_config.ev is not None else '0'}")
-        print(f"  AWB:        {self.cam_config.awb or 'auto'}")
-        print(
-            f"  Saturation: {self.cam_config.saturation if self.cam_config.saturation is not None else 'default'}"
-        )
-        print(
-            f"  Contrast:   {self.cam_config.contrast if self.cam_config.contrast is not None else 'default'}"
-        )
-        print(
-            f"  Brightness: {self.cam_config.brightness if self.cam_config.brightness is not None else 'default'}"
-        )
-        print(
-            f"  Sharpness:  {self.cam_config.sharpness if self.cam_config.sharpness is not None else 'default'}"
-        )
-        print()
-
-        print("ADVANCED:")
-        print(f"  Denoise:    {self.cam_config.denoise or 'default'}")
-        print(f"  Metering:   {self.cam_config.metering or 'default'}")
-        print(
-            f"  Quality:    {self.cam_config.quality if self.cam_config.quality is not None else 'default (93)'}"
-        )
-        print(
-            f"  Shutter:    {self.cam_config.shutter if self.cam_config.shutter is not None else 'auto'} µs"
-        )
-        print(
-            f"  Gain:       {self.cam_config.gain if self.cam_config.gain is not None else 'auto'}"
-        )
-        print()
+        cam = self.cam_config
+
+        def shown(value: object, default: str) -> object:
+            return value if value is not None else default
+
+        lines = [
+            f"\n{'='*60}",
+            f"Camera Settings: {self.profile_name}",
+            f"{'='*60}",
+            f"Test photos: {self.test_dir}",
+            f"Photos taken: {self.test_counter}",
+            "",
+            "RESOLUTION & ORIENTATION:",
+            f"  Resolution: {cam.width}x{cam.height}",
+            f"  Rotation:   {shown(cam.rotation, 'default (0)')}",
+            f"  H-Flip:     {cam.hflip}",
+            f"  V-Flip:     {cam.vflip}",
+            "",
+            "FOCUS:",
+            f"  AF Mode:    {cam.autofocus_mode or 'default'}",
+            f"  Lens Pos:   {shown(cam.lens_position, 'auto')}",
+            "",
+            "EXPOSURE & COLOR:",
+            f"  EV:         {shown(cam.ev, '0')}",
+            f"  AWB:        {cam.awb or 'auto'}",
+            f"  Saturation: {shown(cam.saturation, 'default')}",
+            f"  Contrast:   {shown(cam.contrast, 'default')}",
+            f"  Brightness: {shown(cam.brightness, 'default')}",
+            f"  Sharpness:  {shown(cam.sharpness, 'default')}",
+            "",
+            "ADVANCED:",
+            f"  Denoise:    {cam.denoise or 'default'}",
+            f"  Metering:   {cam.metering or 'default'}",
+            f"  Quality:    {shown(cam.quality, 'default (93)')}",
+            f"  Shutter:    {shown(cam.shutter, 'auto')} µs",
+            f"  Gain:       {shown(cam.gain, 'auto')}",
+            "",
+        ]
+        # One write per screen rather than a print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Static part of the tuning menu, written in one go on every refresh
+_MENU_BANNER = "\n".join(
+    [
+        "=" * 60,
+        "TUNING MENU",
+        "=" * 60,
+        "",
+        "ORIENTATION:",
+        "  [r] Rotation       [h] H-Flip         [v] V-Flip",
+        "",
+        "FOCUS:",
+        "  [f] AF Mode        [l] Lens Position",
+        "",
+        "EXPOSURE & COLOR:",
+        "  [e] EV             [a] AWB Mode       [sa] Saturation",
+        "  [co] Contrast      [br] Brightness    [sh] Sharpness",
+        "",
+        "ADVANCED:",
+        "  [d] Denoise        [m] Metering       [q] Quality",
+        "  [su] Shutter       [g] Gain",
+        "",
+        "ACTIONS:",
+        "  [t] Take test photo",
+        "  [s] Save & exit",
+        "  [x] Exit without saving",
+        "  [z] Rollback to original",
+        "",
+        "",
+    ]
+)
 
 
 def run_tuning_menu(session: TuningSession) -> None:
@@ -210,78 +281,25 @@ def run_tuning_menu(session: TuningSession) -> None:
     while True:
         session.show_current_settings()
 
-        print("=" * 60)
-        print("TUNING MENU")
-        print("=" * 60)
-        print()
-        print("ORIENTATION:")
-        print("  [r] Rotation       [h] H-Flip         [v] V-Flip")
-        print()
-        print("FOCUS:")
-        print("  [f] AF Mode        [l] Lens Position")
-        print()
-        print("EXPOSURE & COLOR:")
-        print("  [e] EV             [a] AWB Mode       [sa] Saturation")
-        print("  [co] Contrast      [br] Brightness    [sh] Sharpness")
-        print()
-        print("ADVANCED:")
-        print("  [d] Denoise        [m] Metering       [q] Quality")
-        print("  [su] Shutter       [g] Gain")
-        print()
-        print("ACTIONS:")
-        print("  [t] Take test photo")
-        print("  [s] Save & exit")
-        print("  [x] Exit without saving")
-        print("  [z] Rollback to original")
-        print()
+        sys.stdout.write(_MENU_BANNER)
 
         choice = input("Choose option: ").strip().lower()
 
-        if choice == "t":
-            handle_test_photo(session)
-        elif choice == "s":
+        if choice == "s":
             handle_save_and_exit(session)
             break
-        elif choice == "x":
+        if choice == "x":
             print("\nExiting without saving...")
             break
-        elif choice == "z":
+        if choice == "z":
             session.rollback()
             print("\n✓ Rolled back to original settings")
-        elif choice == "r":
-            handle_rotation(session)
-        elif choice == "h":
-            handle_hflip(session)
-        elif choice == "v":
-            handle_vflip(session)
-        elif choice == "f":
-            handle_autofocus_mode(session)
-        elif choice == "l":
-            handle_lens_position(session)
-        elif choice == "e":
-            handle_ev(session)
-        elif choice == "a":
-            handle_awb(session)
-        elif choice == "sa":
-            handle_saturation(session)
-        elif choice == "co":
-            handle_contrast(session)
-        elif choice == "br":
-            handle_brightness(session)
-        elif choice == "sh":
-            handle_sharpness(session)
-        elif choice == "d":
-            handle_denoise(session)
-        elif choice == "m":
-            handle_metering(session)
-        elif choice == "q":
-            handle_quality(session)
-        elif choice == "su":
-            handle_shutter(session)
-        elif choice == "g":
-            handle_gain(session)
         else:
-            print(f"\nUnknown option: {choice}")
+            handler = _MENU_HANDLERS.get(choice)
+            if handler is None:
+                print(f"\nUnknown option: {choice}")
+            else:
+                handler(session)
 
         print("\nPress Enter to continue...")
         input()
@@ -310,25 +328,169 @@ def handle_save_and_exit(session: TuningSession) -> None:
         print(f"✗ Save failed: {e}")
 
 
+@dataclass(frozen=True)
+class _NumericSetting:
+    """How to prompt for, parse and validate one numeric camera setting.
+
+    Attributes:
+        field: CameraConfig field to update
+        heading: Lines printed before the prompt
+        unset: Shown as the current value while the field is None
+        parse: Converts the typed text (int or float)
+        low: Smallest accepted value, or None for no lower bound
+        high: Largest accepted value, or None for no upper bound
+        choices: If set, the only accepted values (bounds are then ignored)
+        error: Message printed for a value that fails validation
+        done: Confirmation format string, filled with the new value
+    """
+
+    field: str
+    heading: Tuple[str, ...]
+    unset: str
+    parse: Callable[[str], float]
+    low: Optional[float] = None
+    high: Optional[float] = None
+    choices: Optional[frozenset] = None
+    error: str = "✗ Out of range"
+    done: str = ""
+
+
+_NUMERIC_SETTINGS: Dict[str, _NumericSetting] = {
+    spec.field: spec
+    for spec in (
+        _NumericSetting(
+            "rotation",
+            ("\nRotation (0, 90, 180, 270):",),
+            "0",
+            int,
+            choices=frozenset({0, 90, 180, 270}),
+            error="✗ Must be 0, 90, 180, or 270",
+            done="✓ Rotation set to {}",
+        ),
+        _NumericSetting(
+            "lens_position",
+            (
+                "\nLens Position (0.0=infinity to ~32.0=close):",
+                "  Typical values: 0.0 (far), 2.0 (mid), 8.0 (near)",
+            ),
+            "auto",
+            float,
+            low=0,
+            high=100,
+            done="✓ Lens position: {}",
+        ),
+        _NumericSetting(
+            "ev",
+            ("\nExposure Compensation (-10 to +10):",),
+            "0",
+            int,
+            low=-10,
+            high=10,
+            done="✓ EV: {}",
+        ),
+        _NumericSetting(
+            "saturation",
+            ("\nSaturation (0.0 to 2.0, default 1.0):",),
+            "1.0 (default)",
+            float,
+            low=0,
+            high=2,
+            done="✓ Saturation: {}",
+        ),
+        _NumericSetting(
+            "contrast",
+            ("\nContrast (0.0 to 2.0, default 1.0):",),
+            "1.0 (default)",
+            float,
+            low=0,
+            high=2,
+            done="✓ Contrast: {}",
+        ),
+        _NumericSetting(
+            "brightness",
+            ("\nBrightness (-1.0 to 1.0, default 0.0):",),
+            "0.0 (default)",
+            float,
+            low=-1,
+            high=1,
+            done="✓ Brightness: {}",
+        ),
+        _NumericSetting(
+            "sharpness",
+            ("\nSharpness (0.0 to 2.0, default 1.0):",),
+            "1.0 (default)",
+            float,
+            low=0,
+            high=2,
+            done="✓ Sharpness: {}",
+        ),
+        _NumericSetting(
+            "quality",
+            ("\nJPEG Quality (0-100, default 93):",),
+            "93 (default)",
+            int,
+            low=0,
+            high=100,
+            done="✓ Quality: {}",
+        ),
+        _NumericSetting(
+            "shutter",
+            ("\nShutter Speed (microseconds, e.g., 10000 = 1/100s):", "  Leave empty for auto"),
+            "auto",
+            int,
+            low=0,
+            error="✗ Must be positive",
+            done="✓ Shutter: {} µs",
+        ),
+        _NumericSetting(
+            "gain",
+            ("\nAnalog Gain (typically 1.0-16.0):", "  Leave empty for auto"),
+            "auto",
+            float,
+            low=0,
+            error="✗ Must be positive",
+            done="✓ Gain: {}",
+        ),
+    )
+}
+
+
+def _prompt_numeric(session: TuningSession, spec: _NumericSetting) -> None:
+    """Prompt for a numeric setting and apply it if it parses and validates.
+
+    An empty answer keeps the current value.
+
+    Args:
+        session: Active TuningSession instance
+        spec: Setting to prompt for
+    """
+    current = getattr(session.cam_config, spec.field)
+    print("\n".join(spec.heading))
+    val = input(f"Enter value [current: {spec.unset if current is None else current}]: ").strip()
+    if not val:
+        return
+
+    try:
+        num = spec.parse(val)
+    except ValueError:
+        print("✗ Invalid number")
+        return
+
+    if spec.choices is not None:
+        valid = num in spec.choices
+    else:
+        valid = (spec.low is None or num >= spec.low) and (spec.high is None or num <= spec.high)
+    if not valid:
+        print(spec.error)
+        return
+
+    session.update_setting(**{spec.field: num})
+    print(spec.done.format(num))
+
+
 def handle_rotation(session: TuningSession) -> None:
     """Handle rotation setting."""
-    print("\nRotation (0, 90, 180, 270):")
-    val = input(
-        "Enter value [current: {}]: ".format(
-            session.cam_config.rotation if session.cam_config.rotation is not None else "0"
-        )
-    ).strip()
-
-    if val:
-        try:
-            rot = int(val)
-            if rot not in [0, 90, 180, 270]:
-                print("✗ Must be 0, 90, 180, or 270")
-                return
-            session.update_setting(rotation=rot)
-            print(f"✓ Rotation set to {rot}")
-        except ValueError:
-            print("✗ Invalid number")
+    _prompt_numeric(session, _NUMERIC_SETTINGS["rotation"])
 
 
 def handle_hflip(session: TuningSession) -> None:
@@ -364,44 +526,12 @@ def handle_autofocus_mode(session: TuningSession) -> None:
 
 def handle_lens_position(session: TuningSession) -> None:
     """Handle lens position setting."""
-    current = (
-        session.cam_config.lens_position if session.cam_config.lens_position is not None else "auto"
-    )
-    print("\nLens Position (0.0=infinity to ~32.0=close):")
-    print("  Typical values: 0.0 (far), 2.0 (mid), 8.0 (near)")
-    val = input(f"Enter value [current: {current}]: ").strip()
-
-    if val:
-        try:
-            pos = float(val)
-            if pos < 0 or pos > 100:
-                print("✗ Out of range")
-                return
-            session.update_setting(lens_position=pos)
-            print(f"✓ Lens position: {pos}")
-        except ValueError:
-            print("✗ Invalid number")
+    _prompt_numeric(session, _NUMERIC_SETTINGS["lens_position"])
 
 
 def handle_ev(session: TuningSession) -> None:
     """Handle exposure compensation."""
-    print("\nExposure Compensation (-10 to +10):")
-    val = input(
-        "Enter value [current: {}]: ".format(
-            session.cam_config.ev if session.cam_config.ev is not None else "0"
-        )
-    ).strip()
-
-    if val:
-        try:
-            ev = int(val)
-            if ev < -10 or ev > 10:
-                print("✗ Out of range")
-                return
-            session.update_setting(ev=ev)
-            print(f"✓ EV: {ev}")
-        except ValueError:
-            print("✗ Invalid number")
+    _prompt_numeric(session, _NUMERIC_SETTINGS["ev"])
 
 
 def handle_awb(session: TuningSession) -> None:
@@ -434,88 +564,22 @@ def handle_awb(session: TuningSession) -> None:
 
 def handle_saturation(session: TuningSession) -> None:
     """Handle saturation setting."""
-    current = (
-        session.cam_config.saturation
-        if session.cam_config.saturation is not None
-        else "1.0 (default)"
-    )
-    print(f"\nSaturation (0.0 to 2.0, default 1.0):")
-    val = input(f"Enter value [current: {current}]: ").strip()
-
-    if val:
-        try:
-            sat = float(val)
-            if sat < 0 or sat > 2:
-                print("✗ Out of range")
-                return
-            session.update_setting(saturation=sat)
-            print(f"✓ Saturation: {sat}")
-        except ValueError:
-            print("✗ Invalid number")
+    _prompt_numeric(session, _NUMERIC_SETTINGS["saturation"])
 
 
 def handle_contrast(session: TuningSession) -> None:
     """Handle contrast setting."""
-    current = (
-        session.cam_config.contrast if session.cam_config.contrast is not None else "1.0 (default)"
-    )
-    print(f"\nContrast (0.0 to 2.0, default 1.0):")
-    val = input(f"Enter value [current: {current}]: ").strip()
-
-    if val:
-        try:
-            con = float(val)
-            if con < 0 or con > 2:
-                print("✗ Out of range")
-                return
-            session.update_setting(contrast=con)
-            print(f"✓ Contrast: {con}")
-        except ValueError:
-            print("✗ Invalid number")
+    _prompt_numeric(session, _NUMERIC_SETTINGS["contrast"])
 
 
 def handle_brightness(session: TuningSession) -> None:
     """Handle brightness setting."""
-    current = (
-        session.cam_config.brightness
-        if session.cam_config.brightness is not None
-        else "0.0 (default)"
-    )
-    print(f"\nBrightness (-1.0 to 1.0, default 0.0):")
-    val = input(f"Enter value [current: {current}]: ").strip()
-
-    if val:
-        try:
-            br = float(val)
-            if br < -1 or br > 1:
-                print("✗ Out of range")
-                return
-            session.update_setting(brightness=br)
-            print(f"✓ Brightness: {br}")
-        except ValueError:
-            print("✗ Invalid number")
+    _prompt_numeric(session, _NUMERIC_SETTINGS["brightness"])
 
 
 def handle_sharpness(session: TuningSession) -> None:
     """Handle sharpness setting."""
-    current = (
-        session.cam_config.sharpness
-        if session.cam_config.sharpness is not None
-        else "1.0 (default)"
-    )
-    print(f"\nSharpness (0.0 to 2.0, default 1.0):")
-    val = input(f"Enter value [current: {current}]: ").strip()
-
-    if val:
-        try:
-            sharp = float(val)
-            if sharp < 0 or sharp > 2:
-                print("✗ Out of range")
-                return
-            session.update_setting(sharpness=sharp)
-            print(f"✓ Sharpness: {sharp}")
-        except ValueError:
-            print("✗ Invalid number")
+    _prompt_numeric(session, _NUMERIC_SETTINGS["sharpness"])
 
 
 def handle_denoise(session: TuningSession) -> None:
@@ -558,60 +622,39 @@ def handle_metering(session: TuningSession) -> None:
 
 def handle_quality(session: TuningSession) -> None:
     """Handle JPEG quality."""
-    current = (
-        session.cam_config.quality if session.cam_config.quality is not None else "93 (default)"
-    )
-    print(f"\nJPEG Quality (0-100, default 93):")
-    val = input(f"Enter value [current: {current}]: ").strip()
-
-    if val:
-        try:
-            qual = int(val)
-            if qual < 0 or qual > 100:
-                print("✗ Out of range")
-                return
-            session.update_setting(quality=qual)
-            print(f"✓ Quality: {qual}")
-        except ValueError:
-            print("✗ Invalid number")
+    _prompt_numeric(session, _NUMERIC_SETTINGS["quality"])
 
 
 def handle_shutter(session: TuningSession) -> None:
     """Handle shutter speed."""
-    current = session.cam_config.shutter if session.cam_config.shutter is not None else "auto"
-    print("\nShutter Speed (microseconds, e.g., 10000 = 1/100s):")
-    print("  Leave empty for auto")
-    val = input(f"Enter value [current: {current}]: ").strip()
-
-    if val:
-        try:
-            shutter = int(val)
-            if shutter < 0:
-                print("✗ Must be positive")
-                return
-            session.update_setting(shutter=shutter)
-            print(f"✓ Shutter: {shutter} µs")
-        except ValueError:
-            print("✗ Invalid number")
+    _prompt_numeric(session, _NUMERIC_SETTINGS["shutter"])
 
 
 def handle_gain(session: TuningSession) -> None:
     """Handle analog gain."""
-    current = session.cam_config.gain if session.cam_config.gain is not None else "auto"
-    print("\nAnalog Gain (typically 1.0-16.0):")
-    print("  Leave empty for auto")
-    val = input(f"Enter value [current: {current}]: ").strip()
-
-    if val:
-        try:
-            gain = float(val)
-            if gain < 0:
-                print("✗ Must be positive")
-                return
-            session.update_setting(gain=gain)
-            print(f"✓ Gain: {gain}")
-        except ValueError:
-            print("✗ Invalid number")
+    _prompt_numeric(session, _NUMERIC_SETTINGS["gain"])
+
+
+# Menu choice -> handler, for every option that keeps the menu open
+_MENU_HANDLERS: Dict[str, Callable[[TuningSession], None]] = {
+    "t": handle_test_photo,
+    "r": handle_rotation,
+    "h": handle_hflip,
+    "v": handle_vflip,
+    "f": handle_autofocus_mode,
+    "l": handle_lens_position,
+    "e": handle_ev,
+    "a": handle_awb,
+    "sa": handle_saturation,
+    "co": handle_contrast,
+    "br": handle_brightness,
+    "sh": handle_sharpness,
+    "d": handle_denoise,
+    "m": handle_metering,
+    "q": handle_quality,
+    "su": handle_shutter,
+    "g": handle_gain,
+}
 
 
 def tune_profile(config_path: Path, profile_name: str) -> int:
@@ -639,7 +682,10 @@ def tune_profile(config_path: Path, profile_name: str) -> int:
         print()
         input("Press Enter to start tuning...")
 
-        run_tuning_menu(session)
+        try:
+            run_tuning_menu(session)
+        finally:
+            session.close()
 
         return 0
 
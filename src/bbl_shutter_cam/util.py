@@ -9,11 +9,14 @@ Provides:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
+import atexit
+from dataclasses import dataclass, field
 from enum import IntEnum
 import os
 from pathlib import Path
+import sys
+import time
+from types import MappingProxyType
 from typing import Any, Iterable, Optional, TextIO
 
 
@@ -33,13 +36,55 @@ class LogLevel(IntEnum):
     ERROR = 40
 
 
-_LEVEL_NAMES = {
-    "debug": LogLevel.DEBUG,
-    "info": LogLevel.INFO,
-    "warning": LogLevel.WARNING,
-    "warn": LogLevel.WARNING,
-    "error": LogLevel.ERROR,
-}
+# Logger method name -> the level it logs at
+_METHOD_LEVELS = (
+    ("debug", LogLevel.DEBUG),
+    ("info", LogLevel.INFO),
+    ("warning", LogLevel.WARNING),
+    ("error", LogLevel.ERROR),
+)
+
+
+# Debug lines written to the log file between flushes; info and above flush at once
+_FLUSH_EVERY = 50
+
+
+def _noop(_msg: str, *_args: Any) -> None:
+    """Stand-in for log methods below the current level."""
+
+
+class _LevelField:
+    """Logger.level: assigning it points methods below the level at _noop.
+
+    Disabled calls then cost a single function call; their arguments are
+    never formatted. As a dataclass field default, the descriptor also
+    supplies the default level when read from the class.
+    """
+
+    def __get__(self, obj: Optional[Logger], objtype: Any = None) -> LogLevel:
+        if obj is None:
+            return LogLevel.INFO
+        level: LogLevel = obj.__dict__["_level"]
+        return level
+
+    def __set__(self, obj: Logger, value: LogLevel) -> None:
+        obj.__dict__["_level"] = value
+        for name, lvl in _METHOD_LEVELS:
+            if value > lvl:
+                obj.__dict__[name] = _noop
+            else:
+                obj.__dict__.pop(name, None)
+
+
+_LEVEL_NAMES = MappingProxyType(
+    {
+        "debug": LogLevel.DEBUG,
+        "info": LogLevel.INFO,
+        "warning": LogLevel.WARNING,
+        "warn": LogLevel.WARNING,
+        "error": LogLevel.ERROR,
+    }
+)
 
 
 @dataclass
@@ -57,9 +102,13 @@ class Logger:
         2026-02-14 12:34:56 [=] Starting application
     """
 
-    level: LogLevel = LogLevel.INFO
+    level: _LevelField = _LevelField()  # reads and writes a LogLevel
     fmt: str = "plain"  # "plain" | "time"
     file: Optional[TextIO] = None
+    # Last formatted timestamp and the epoch second it is for, reused within that second
+    _ts_sec: int = field(default=-1, init=False, repr=False, compare=False)
+    _ts_str: str = field(default="", init=False, repr=False, compare=False)
+    _unflushed: int = field(default=0, init=False, repr=False, compare=False)
 
     def _prefix(self, tag: str) -> str:
         """Generate log line prefix with optional timestamp.
@@ -71,24 +120,49 @@ class Logger:
             Formatted prefix string
         """
         if self.fmt == "time":
-            ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            return f"{ts} {tag}"
+            now = int(time.time())
+            if now != self._ts_sec:
+                self._ts_sec = now
+                self._ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            return f"{self._ts_str} {tag}"
         return tag
 
-    def _write(self, line: str) -> None:
+    def _write(self, line: str, flush: bool = False) -> None:
         """Write log line to stdout and optional file.
 
+        The file is flushed every _FLUSH_EVERY lines rather than after each
+        one, and immediately when flush is set.
+
         Args:
             line: Complete formatted log line
+            flush: Flush the file now (used for info and above)
         """
-        print(line)
+        out = line + "\n"
+        sys.stdout.write(out)
         if self.file:
             try:
-                self.file.write(line + "\n")
-                self.file.flush()
+                self.file.write(out)
+                self._unflushed += 1
+                if flush or self._unflushed >= _FLUSH_EVERY:
+                    self.file.flush()
+                    self._unflushed = 0
             except Exception:
                 pass
 
+    def enabled_for(self, level: LogLevel) -> bool:
+        """Check whether a message at level would be written.
+
+        Use this to skip building expensive log arguments that would be
+        discarded anyway.
+
+        Args:
+            level: LogLevel of the prospective message
+
+        Returns:
+            True if messages at level pass the current threshold
+        """
+        return self.level <= level
+
     def debug(self, msg: str, *args: Any) -> None:
         """Log a debug-level message.
 
@@ -109,7 +183,7 @@ class Logger:
         """
         if self.level <= LogLevel.INFO:
             formatted = msg % args if args else msg
-            self._write(f"{self._prefix('[=]')} {formatted}")
+            self._write(f"{self._prefix('[=]')} {formatted}", flush=True)
 
     def warning(self, msg: str, *args: Any) -> None:
         """Log a warning-level message.
@@ -120,7 +194,7 @@ class Logger:
         """
         if self.level <= LogLevel.WARNING:
             formatted = msg % args if args else msg
-            self._write(f"{self._prefix('[!]')} {formatted}")
+            self._write(f"{self._prefix('[!]')} {formatted}", flush=True)
 
     def error(self, msg: str, *args: Any) -> None:
         """Log an error-level message.
@@ -131,7 +205,7 @@ class Logger:
         """
         if self.level <= LogLevel.ERROR:
             formatted = msg % args if args else msg
-            self._write(f"{self._prefix('[X]')} {formatted}")
+            self._write(f"{self._prefix('[X]')} {formatted}", flush=True)
 
 
 # Global logger instance used throughout the application.
@@ -139,14 +213,14 @@ LOG = Logger()
 
 
 def configure_logging(
-    level: str = "info",
+    level: str | LogLevel = "info",
     fmt: str = "plain",
     log_file: Optional[str | Path] = None,
 ) -> None:
     """Configure the global logger instance.
 
     Args:
-        level: Log level as string: "debug", "info", "warning", "error"
+        level: LogLevel, or its name as a string: "debug", "info", "warning", "error"
         fmt: Log format - "plain" (no timestamps) or "time" (with timestamps)
         log_file: Optional file path for logging (creates parent dirs automatically)
 
@@ -157,7 +231,7 @@ def configure_logging(
         >>> configure_logging(level="debug", fmt="time", log_file="~/.log/app.log")
         >>> LOG.debug("This appears in both stdout and file")
     """
-    lvl = _LEVEL_NAMES.get(level.lower())
+    lvl = level if isinstance(level, LogLevel) else _LEVEL_NAMES.get(level.lower())
     if lvl is None:
         raise ValueError(f"Invalid log level: {level!r} (use debug|info|warning|error)")
     if fmt not in ("plain", "time"):
@@ -169,9 +243,25 @@ def configure_logging(
     if log_file:
         path = Path(log_file).expanduser()
         path.parent.mkdir(parents=True, exist_ok=True)
+        _close_log_file()
         # pylint: disable=consider-using-with
-        LOG.file = path.open("a", buffering=1, encoding="utf-8")
-        LOG.debug(f"Logging to file: {path}")
+        LOG.file = path.open("a", buffering=8192, encoding="utf-8")
+        # Batched debug lines still reach the file on a normal exit
+        atexit.register(LOG.file.close)
+        LOG.debug("Logging to file: %s", path)
+
+
+def _close_log_file() -> None:
+    """Flush and close the global logger's file and drop its exit hook."""
+    old = LOG.file
+    if old is None:
+        return
+    LOG.file = None
+    atexit.unregister(old.close)
+    try:
+        old.close()  # flushes any batched debug lines first
+    except Exception:
+        pass
 
 
 def expand_path(p: str | Path) -> Path:
@@ -209,6 +299,10 @@ def ensure_dir(p: str | Path) -> Path:
     return d
 
 
+# Sentinel for safe_get: distinguishes a missing key from a stored None
+_MISSING = object()
+
+
 def safe_get(d: dict, keys: Iterable[str], default: Any = None) -> Any:
     """Safely access nested dictionary keys with default fallback.
 
@@ -232,9 +326,11 @@ def safe_get(d: dict, keys: Iterable[str], default: Any = None) -> Any:
     """
     cur: Any = d
     for key in keys:
-        if not isinstance(cur, dict) or key not in cur:
+        if not isinstance(cur, dict):
+            return default
+        cur = cur.get(key, _MISSING)
+        if cur is _MISSING:
             return default
-        cur = cur[key]
     return cur
 
 
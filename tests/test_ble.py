@@ -1,6 +1,7 @@
 """Unit tests for ble.py module."""
 
 import asyncio
+from types import SimpleNamespace
 
 import pytest
 
@@ -71,6 +72,79 @@ def test_connect_with_retry_retries(monkeypatch):
     assert calls["count"] >= 2
 
 
+def test_connect_with_retry_backs_off_exponentially(monkeypatch):
+    delays = []
+
+    def fake_client(mac):
+        return FakeBleakClient(mac, should_connect=len(delays) >= 5)
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(ble, "BleakClient", fake_client)
+    monkeypatch.setattr(ble.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(ble.random, "uniform", lambda _a, _b: 1.0)
+
+    asyncio.run(ble.connect_with_retry("AA:BB", reconnect_delay=1.0, max_delay=4.0))
+
+    assert delays == [1.0, 2.0, 4.0, 4.0, 4.0]
+
+
+def test_backoff_delay_jitter_bounds():
+    for attempt in range(100):
+        assert 2.0 <= ble.backoff_delay(attempt, 4.0, 8.0) <= 12.0
+
+
+def test_connect_with_retry_reuses_service_cache(monkeypatch):
+    connect_kwargs = []
+
+    class CachingClient(FakeBleakClient):
+        services = ["svc"]
+
+        async def connect(self, **kwargs):
+            connect_kwargs.append(kwargs)
+            self.is_connected = True
+
+    monkeypatch.setattr(ble, "BleakClient", CachingClient)
+    monkeypatch.setattr(ble, "_SERVICE_CACHE", set())
+
+    asyncio.run(ble.connect_with_retry("AA:BB"))
+    asyncio.run(ble.connect_with_retry("AA:BB"))
+
+    assert connect_kwargs == [{}, {"dangerous_use_bleak_cache": True}]
+    assert "AA:BB" in ble._SERVICE_CACHE
+
+    asyncio.run(ble.connect_with_retry("aa:bb"))
+
+    assert connect_kwargs[-1] == {"dangerous_use_bleak_cache": True}
+
+    ble.invalidate_cache("AA:BB")
+    asyncio.run(ble.connect_with_retry("AA:BB"))
+
+    assert connect_kwargs[-1] == {}
+
+
+def test_connect_with_retry_drops_service_cache_after_failure(monkeypatch):
+    connect_kwargs = []
+
+    class FlakyClient(FakeBleakClient):
+        services = ["svc"]
+
+        async def connect(self, **kwargs):
+            connect_kwargs.append(kwargs)
+            if len(connect_kwargs) == 1:
+                raise RuntimeError("stale handles")
+            self.is_connected = True
+
+    monkeypatch.setattr(ble, "BleakClient", FlakyClient)
+    monkeypatch.setattr(ble, "_SERVICE_CACHE", {"AA:BB"})
+    monkeypatch.setattr(ble, "backoff_delay", lambda *_args: 0)
+
+    asyncio.run(ble.connect_with_retry("AA:BB"))
+
+    assert connect_kwargs == [{"dangerous_use_bleak_cache": True}, {}]
+
+
 def test_get_services_compat_with_get_services_coroutine():
     class Client:
         async def get_services(self):
@@ -98,6 +172,26 @@ def test_get_services_compat_with_services_attr(monkeypatch):
     assert services == ["svc"]
 
 
+def test_get_services_compat_backs_off_until_populated(monkeypatch):
+    class Client:
+        services = None
+
+    client = Client()
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        if len(delays) == 3:
+            client.services = ["svc"]
+
+    monkeypatch.setattr(ble.asyncio, "sleep", fake_sleep)
+
+    services = asyncio.run(ble.get_services_compat(client))
+
+    assert services == ["svc"]
+    assert delays == [0.01, 0.02, 0.04]
+
+
 def test_get_services_compat_timeout(monkeypatch):
     class Client:
         services = None
@@ -126,6 +220,35 @@ def test_list_notify_characteristics(monkeypatch):
     assert result == ["uuid-1", "uuid-3"]
 
 
+def test_list_notify_characteristics_is_cached(monkeypatch):
+    calls = {"count": 0}
+
+    async def fake_get_services(_client):
+        calls["count"] += 1
+        return [FakeService([FakeChar("uuid-1", ["notify"])])]
+
+    monkeypatch.setattr(ble, "get_services_compat", fake_get_services)
+    monkeypatch.setattr(ble, "_NOTIFY_UUID_CACHE", {})
+
+    client = FakeBleakClient("AA:BB")
+    client.address = "AA:BB"
+
+    assert asyncio.run(ble.list_notify_characteristics(client)) == ["uuid-1"]
+    assert asyncio.run(ble.list_notify_characteristics(client)) == ["uuid-1"]
+
+    reconnected = FakeBleakClient("AA:BB")
+    reconnected.address = "AA:BB"
+    assert asyncio.run(ble.list_notify_characteristics(reconnected)) == ["uuid-1"]
+    assert calls["count"] == 1
+
+    # A lowercase MAC from config still clears the backend's uppercase address
+    ble.invalidate_cache("aa:bb")
+    fresh = FakeBleakClient("AA:BB")
+    fresh.address = "AA:BB"
+    asyncio.run(ble.list_notify_characteristics(fresh))
+    assert calls["count"] == 2
+
+
 def test_start_notify_best_effort():
     client = FakeBleakClient("AA:BB")
 
@@ -140,6 +263,22 @@ def test_start_notify_best_effort():
     assert active == ["good-1", "good-2"]
 
 
+def test_start_notify_best_effort_can_warn_on_failures(capsys):
+    client = FakeBleakClient("AA:BB")
+
+    active = asyncio.run(
+        ble.start_notify_best_effort(
+            client,
+            ["good-1", "bad-1"],
+            lambda _uuid: lambda _sender, _data: None,
+            warn_failures=True,
+        )
+    )
+
+    assert active == ["good-1"]
+    assert "Failed to subscribe to bad-1: notify failed" in capsys.readouterr().out
+
+
 def test_stop_notify_best_effort():
     client = FakeBleakClient("AA:BB")
 
@@ -147,3 +286,50 @@ def test_stop_notify_best_effort():
         await ble.stop_notify_best_effort(client, ["good-1", "bad-1"])
 
     asyncio.run(run())
+    assert client._stop_notify_calls == ["good-1", "bad-1"]
+
+
+def test_connect_with_retry_passes_disconnected_callback(monkeypatch):
+    captured = {}
+
+    class CallbackClient(FakeBleakClient):
+        def __init__(self, mac, disconnected_callback=None):
+            super().__init__(mac)
+            captured["cb"] = disconnected_callback
+
+    monkeypatch.setattr(ble, "BleakClient", CallbackClient)
+    ble.invalidate_cache("AA:BB")
+
+    def on_disconnect(_client):
+        return None
+
+    asyncio.run(ble.connect_with_retry("AA:BB", disconnected_callback=on_disconnect))
+
+    assert captured["cb"] is on_disconnect
+
+
+def test_notify_ring_batches_notifications():
+    async def run():
+        ring = ble.NotifyRing(maxlen=2)
+        cb_a = ring.callback_factory("a")
+        cb_b = ring.callback_factory("b")
+        cb_a(0, bytearray(b"\x01"))
+        cb_b(0, bytearray(b"\x02"))
+        cb_a(0, bytearray(b"\x03"))
+        batch = await ring.drain()
+        return batch, ring.event.is_set(), ring.pop_all()
+
+    batch, pending, rest = asyncio.run(run())
+
+    # Oldest entry dropped once the ring is full
+    assert batch == [("b", b"\x02"), ("a", b"\x03")]
+    assert pending is False
+    assert rest == []
+
+
+def test_notify_ring_callback_keys_on_sender_uuid():
+    ring = ble.NotifyRing()
+
+    ring.callback(SimpleNamespace(uuid="uuid-1"), bytearray(b"\x40\x00"))
+
+    assert ring.pop_all() == [("uuid-1", b"\x40\x00")]
@@ -3,7 +3,9 @@
 Tests camera configuration, command building, and file management.
 """
 
+import sys
 import tempfile
+import types
 from datetime import datetime
 from pathlib import Path
 
@@ -11,12 +13,66 @@ import pytest
 
 from bbl_shutter_cam.camera import (
     CameraConfig,
+    CameraSession,
     build_rpicam_still_cmd,
     camera_config_from_profile,
     make_outfile,
+    open_camera_session,
 )
 
 
+class FakePicamera2:
+    instances = []
+
+    def __init__(self):
+        self.options = {}
+        self.controls = {}
+        self.captured = []
+        self.started = False
+        self.closed = False
+        FakePicamera2.instances.append(self)
+
+    def create_still_configuration(self, main, transform):
+        return {"main": main, "transform": transform}
+
+    def configure(self, config):
+        self.config = config
+
+    def set_controls(self, controls):
+        self.controls.update(controls)
+
+    def start(self):
+        self.started = True
+
+    def capture_file(self, outfile):
+        self.captured.append(outfile)
+
+    def stop(self):
+        self.started = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_picamera2(monkeypatch):
+    """Install fake picamera2/libcamera modules."""
+    enum = types.SimpleNamespace
+    libcamera = types.ModuleType("libcamera")
+    libcamera.Transform = lambda hflip=False, vflip=False: (hflip, vflip)
+    libcamera.controls = types.SimpleNamespace(
+        AwbModeEnum=enum(Auto="awb-auto", Daylight="awb-daylight"),
+        AeMeteringModeEnum=enum(CentreWeighted="m-centre", Spot="m-spot"),
+        AfModeEnum=enum(Manual="af-manual", Auto="af-auto", Continuous="af-cont"),
+    )
+    picamera2 = types.ModuleType("picamera2")
+    picamera2.Picamera2 = FakePicamera2
+    FakePicamera2.instances = []
+    monkeypatch.setitem(sys.modules, "libcamera", libcamera)
+    monkeypatch.setitem(sys.modules, "picamera2", picamera2)
+    return FakePicamera2
+
+
 class TestCameraConfig:
     """Test CameraConfig dataclass."""
 
@@ -38,6 +94,17 @@ class TestCameraConfig:
         with pytest.raises(Exception):  # FrozenInstanceError
             config.width = 3840
 
+    def test_static_argv_derived_from_fields(self):
+        """Should precompute flags and recompute them when fields are replaced."""
+        from dataclasses import replace
+
+        config = CameraConfig(output_dir="/tmp", width=640, height=480)
+        rotated = replace(config, rotation=180)
+
+        assert config.static_argv == ("--nopreview", "--width", "640", "--height", "480")
+        assert rotated.static_argv[-2:] == ("--rotation", "180")
+        assert config == CameraConfig(output_dir="/tmp", width=640, height=480)
+
     def test_optional_parameters_default_to_none(self):
         """Optional camera parameters should default to None."""
         config = CameraConfig(output_dir="/tmp")
@@ -162,6 +229,80 @@ class TestCameraConfigFromProfile:
         assert config.lens_position == 10.5
         assert config.quality == 90
 
+    def test_coerces_legacy_rpicam_values(self):
+        """Should accept values that convert cleanly, as older configs wrote them."""
+        profile = {
+            "camera": {
+                "rpicam": {
+                    "shutter": 10000.0,
+                    "width": "4056",
+                    "ev": "0.5",
+                    "gain": "2",
+                    "awb": 5,
+                    "hflip": "true",
+                    "nopreview": 0,
+                }
+            }
+        }
+
+        config = camera_config_from_profile(profile)
+
+        assert config.shutter == 10000 and isinstance(config.shutter, int)
+        assert config.width == 4056
+        assert config.ev == 0.5
+        assert config.gain == 2
+        assert config.awb == "5"
+        assert config.hflip is True
+        assert config.nopreview is False
+
+    @pytest.mark.parametrize(
+        "name, value",
+        [
+            ("shutter", 10000.5),
+            ("quality", "high"),
+            ("vflip", "maybe"),
+            ("width", True),
+            ("ev", False),
+            ("awb", True),
+        ],
+    )
+    def test_rejects_unconvertible_rpicam_values(self, name, value):
+        """Should reject values with no clean conversion."""
+        with pytest.raises(ValueError, match=f"camera.rpicam.{name}"):
+            camera_config_from_profile({"camera": {"rpicam": {name: value}}})
+
+    def test_rejects_mistyped_rpicam_option(self):
+        """Should fail at load time rather than pass garbage to rpicam-still."""
+        profile = {"camera": {"rpicam": {"width": "wide"}}}
+
+        with pytest.raises(ValueError, match="camera.rpicam.width"):
+            camera_config_from_profile(profile)
+
+    def test_warns_on_unknown_rpicam_option(self, capsys):
+        """Should ignore unknown options with a warning."""
+        profile = {"camera": {"rpicam": {"widht": 100}}}
+
+        config = camera_config_from_profile(profile)
+
+        assert config.width == 1920
+        assert "widht" in capsys.readouterr().out
+
+    def test_rejects_filename_format_with_separator(self):
+        """Should reject formats that would write into subdirectories."""
+        profile = {"camera": {"filename_format": "%Y/%m%d.jpg"}}
+
+        with pytest.raises(ValueError, match="filename_format"):
+            camera_config_from_profile(profile)
+
+    def test_warns_on_constant_filename_format(self, capsys):
+        """Should warn when every capture would get the same name."""
+        profile = {"camera": {"filename_format": "photo.jpg"}}
+
+        config = camera_config_from_profile(profile)
+
+        assert config.filename_format == "photo.jpg"
+        assert "overwrite" in capsys.readouterr().out
+
     def test_handles_empty_profile(self):
         """Should handle minimal profile with defaults."""
         profile = {"_profile_name": "minimal"}
@@ -306,6 +447,17 @@ class TestBuildRpicamStillCmd:
         assert "--awb" not in cmd
         assert "--saturation" not in cmd
 
+    def test_only_outfile_changes_between_calls(self):
+        """Should reuse the static flags and only swap the output path."""
+        config = CameraConfig(output_dir="/tmp", rotation=90, quality=80)
+
+        first = build_rpicam_still_cmd(config, "/tmp/a.jpg")
+        second = build_rpicam_still_cmd(config, "/tmp/b.jpg")
+
+        assert first[:3] == ["rpicam-still", "-o", "/tmp/a.jpg"]
+        assert second[:3] == ["rpicam-still", "-o", "/tmp/b.jpg"]
+        assert first[3:] == second[3:]
+
     def test_command_is_list_of_strings(self):
         """Should return list of strings suitable for subprocess."""
         config = CameraConfig(output_dir="/tmp", width=1920)
@@ -385,3 +537,102 @@ class TestMakeOutfile:
         make_outfile(config)
 
         assert nested_dir.exists()
+
+    def test_recreates_directory_removed_between_captures(self, tmp_path):
+        """Should create the directory again if it disappears after first use."""
+        out_dir = tmp_path / "captures"
+        config = CameraConfig(output_dir=str(out_dir), filename_format="%H%M%S.jpg")
+
+        make_outfile(config)
+        out_dir.rmdir()
+        outfile = make_outfile(config)
+
+        assert out_dir.is_dir()
+        assert outfile.startswith(f"{out_dir}/")
+
+
+class TestCameraSession:
+    """Test the persistent Picamera2-backed CameraSession."""
+
+    def test_configures_camera_once_and_captures(self, fake_picamera2):
+        """Should configure controls up front and capture without reconfiguring."""
+        config = CameraConfig(
+            output_dir="/tmp",
+            width=1280,
+            height=720,
+            rotation=180,
+            hflip=True,
+            awb="daylight",
+            ev=1,
+            awbgains="1.5,1.8",
+            metering="spot",
+            autofocus_mode="manual",
+            lens_position=2.0,
+            quality=90,
+        )
+
+        session = CameraSession(config)
+        session.capture("/tmp/a.jpg")
+        session.capture("/tmp/b.jpg")
+        session.close()
+
+        picam = fake_picamera2.instances[0]
+        assert picam.config == {"main": {"size": (1280, 720)}, "transform": (False, True)}
+        assert picam.options["quality"] == 90
+        assert picam.controls["AwbMode"] == "awb-daylight"
+        assert picam.controls["ExposureValue"] == 1.0
+        assert picam.controls["ColourGains"] == (1.5, 1.8)
+        assert picam.controls["AeMeteringMode"] == "m-spot"
+        assert picam.controls["AfMode"] == "af-manual"
+        assert picam.controls["LensPosition"] == 2.0
+        assert picam.captured == ["/tmp/a.jpg", "/tmp/b.jpg"]
+        assert picam.closed is True
+
+    def test_open_session_returns_none_for_quarter_rotation(self, fake_picamera2):
+        """90/270 degree rotations should fall back to rpicam-still."""
+        assert open_camera_session(CameraConfig(output_dir="/tmp", rotation=90)) is None
+        assert fake_picamera2.instances == []
+
+    @pytest.mark.parametrize(
+        "setting",
+        [
+            {"denoise": "cdn_off"},
+            {"timeout": 2000},
+            {"nopreview": False},
+            {"awb": "sunset"},
+            {"metering": "average"},
+            {"autofocus_mode": "macro"},
+        ],
+    )
+    def test_open_session_returns_none_for_settings_it_cannot_apply(
+        self, fake_picamera2, setting, capsys
+    ):
+        """Settings the session would drop should fall back to rpicam-still."""
+        from bbl_shutter_cam.util import LOG, LogLevel
+
+        config = CameraConfig(output_dir="/tmp", **setting)
+        LOG.level = LogLevel.DEBUG
+        try:
+            assert CameraSession.supports(config) is False
+            assert open_camera_session(config) is None
+        finally:
+            LOG.level = LogLevel.INFO
+        assert fake_picamera2.instances == []
+        assert next(iter(setting)) in capsys.readouterr().out
+
+    def test_open_session_returns_none_without_picamera2(self, monkeypatch):
+        """Should fall back when picamera2 is not installed."""
+        monkeypatch.setitem(sys.modules, "picamera2", None)
+
+        assert open_camera_session(CameraConfig(output_dir="/tmp")) is None
+
+    def test_open_session_returns_none_when_camera_fails(self, fake_picamera2, monkeypatch):
+        """Should fall back when the camera cannot be started."""
+
+        def broken_start(_self):
+            raise RuntimeError("camera busy")
+
+        monkeypatch.setattr(fake_picamera2, "start", broken_start)
+
+        assert open_camera_session(CameraConfig(output_dir="/tmp")) is None
+        assert fake_picamera2.instances[0].closed is True
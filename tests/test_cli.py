@@ -4,7 +4,7 @@ import argparse
 
 import pytest
 
-from bbl_shutter_cam import cli
+from bbl_shutter_cam import cli, discover
 
 
 class FakeDevice:
@@ -28,6 +28,21 @@ def test_build_parser_parses_tune_command():
     assert isinstance(args.config, object)
 
 
+def test_build_parser_for_single_command():
+    parser = cli._build_parser("scan")
+    args = parser.parse_args(["scan", "--timeout", "3"])
+
+    assert args.timeout == 3.0
+    with pytest.raises(SystemExit):
+        parser.parse_args(["tune", "--profile", "office"])
+
+
+def test_peek_command_skips_global_options():
+    assert cli._peek_command(["--log-level", "debug", "run", "--dry-run"]) == "run"
+    assert cli._peek_command(["run", "--help"]) is None
+    assert cli._peek_command([]) is None
+
+
 def test_main_dispatches_to_command(monkeypatch):
     called = {}
 
@@ -50,6 +65,24 @@ def test_main_dispatches_to_command(monkeypatch):
     assert called.get("logging") is True
 
 
+def test_main_normalizes_config_path(monkeypatch):
+    seen = {}
+
+    def fake_cmd(args: argparse.Namespace) -> int:
+        seen["config"] = args.config
+        return 0
+
+    monkeypatch.setattr(cli, "_cmd_tune", fake_cmd)
+    monkeypatch.setattr(cli, "configure_logging", lambda **_kwargs: None)
+
+    with pytest.raises(SystemExit):
+        cli.main(["--config", "~/cfg/../config.toml", "tune", "--profile", "office"])
+
+    assert seen["config"].is_absolute()
+    assert "~" not in str(seen["config"])
+    assert ".." not in seen["config"].parts
+
+
 def test_main_exits_when_missing_command():
     with pytest.raises(SystemExit) as exc:
         cli.main([])
@@ -57,11 +90,42 @@ def test_main_exits_when_missing_command():
     assert exc.value.code == 2
 
 
+def test_async_run_prefers_uvloop(monkeypatch):
+    import sys
+    import types
+
+    ran = []
+
+    def fake_run(coro):
+        ran.append(coro)
+        coro.close()
+        return "uvloop"
+
+    monkeypatch.setitem(sys.modules, "uvloop", types.SimpleNamespace(run=fake_run))
+
+    async def work():
+        return "asyncio"
+
+    assert cli._async_run(work()) == "uvloop"
+    assert len(ran) == 1
+
+
+def test_async_run_falls_back_to_asyncio(monkeypatch):
+    import sys
+
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    async def work():
+        return 42
+
+    assert cli._async_run(work()) == 42
+
+
 def test_cmd_scan_no_devices(monkeypatch):
     async def fake_scan(**_kwargs):
         return []
 
-    monkeypatch.setattr(cli.discover, "scan", fake_scan)
+    monkeypatch.setattr(discover, "scan", fake_scan)
 
     args = argparse.Namespace(name=None, timeout=0.1)
     rc = cli._cmd_scan(args)
@@ -73,7 +137,7 @@ def test_cmd_scan_lists_devices(monkeypatch, capsys):
     async def fake_scan(**_kwargs):
         return [FakeDevice("BBL_SHUTTER", "AA:BB")]
 
-    monkeypatch.setattr(cli.discover, "scan", fake_scan)
+    monkeypatch.setattr(discover, "scan", fake_scan)
 
     args = argparse.Namespace(name=None, timeout=0.1)
     rc = cli._cmd_scan(args)
@@ -87,7 +151,7 @@ def test_cmd_setup_success(monkeypatch, tmp_path, capsys):
     async def fake_setup(**_kwargs):
         return ("AA:BB", "uuid-1")
 
-    monkeypatch.setattr(cli.discover, "setup_profile", fake_setup)
+    monkeypatch.setattr(discover, "setup_profile", fake_setup)
     monkeypatch.setattr(cli, "ensure_config_exists", lambda _path: None)
 
     args = argparse.Namespace(
@@ -132,15 +196,47 @@ def test_cmd_run_invokes_discover(monkeypatch, tmp_path):
         "load_profile",
         lambda _path, _name: {"device": {"mac": "AA:BB", "notify_uuid": "uuid"}},
     )
-    monkeypatch.setattr(cli.discover, "run_profile", fake_run_profile)
+    monkeypatch.setattr(discover, "run_profile", fake_run_profile)
 
     args = argparse.Namespace(
         config=tmp_path / "config.toml",
         profile="office",
         dry_run=True,
         verbose=False,
-        reconnect_delay=0.1,
+        reconnect_delay=None,
+        reconnect_min=1.0,
+        reconnect_max=64.0,
     )
     rc = cli._cmd_run(args)
 
     assert rc == 0
+
+
+def test_cmd_run_reports_invalid_camera_settings(monkeypatch, tmp_path, capsys):
+    async def fail_run_profile(*_args, **_kwargs):
+        pytest.fail("run_profile should not start with invalid camera settings")
+
+    monkeypatch.setattr(cli, "ensure_config_exists", lambda _path: None)
+    monkeypatch.setattr(
+        cli,
+        "load_profile",
+        lambda _path, _name: {
+            "device": {"mac": "AA:BB", "notify_uuid": "uuid"},
+            "camera": {"rpicam": {"width": "wide"}},
+        },
+    )
+    monkeypatch.setattr(discover, "run_profile", fail_run_profile)
+
+    args = argparse.Namespace(
+        config=tmp_path / "config.toml",
+        profile="office",
+        dry_run=True,
+        verbose=False,
+        reconnect_delay=None,
+        reconnect_min=1.0,
+        reconnect_max=64.0,
+    )
+    rc = cli._cmd_run(args)
+
+    assert rc == 1
+    assert "camera.rpicam.width" in capsys.readouterr().out
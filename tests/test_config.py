@@ -12,10 +12,13 @@ from tomlkit import document, dumps
 from bbl_shutter_cam.config import (
     APP_NAME,
     ensure_config_exists,
+    forget_ensured,
     get_event_trigger_bytes,
     get_trigger_events,
     load_config,
+    load_config_editable,
     load_profile,
+    Profile,
     save_config,
     update_profile_device_fields,
 )
@@ -82,6 +85,33 @@ class TestEnsureConfigExists:
         assert default_prof["camera"]["rpicam"]["height"] == 1080
         assert default_prof["camera"]["rpicam"]["nopreview"] is True
 
+    def test_escapes_output_dir_in_default_config(self, tmp_path, monkeypatch):
+        """Should write home paths with quotes or backslashes as valid TOML."""
+        from bbl_shutter_cam import config as config_mod
+
+        odd_home = tmp_path / 'C:\\Users\\"me"'
+        monkeypatch.setattr(config_mod, "_HOME", odd_home)
+        config_path = tmp_path / "config.toml"
+        ensure_config_exists(config_path)
+
+        camera = load_config(config_path)["profiles"]["default"]["camera"]
+        assert camera["output_dir"] == str(odd_home / "captures" / "default")
+        assert camera["filename_format"] == "%Y%m%d_%H%M%S.jpg"
+        assert camera["min_interval_sec"] == 0.5
+
+    def test_checks_filesystem_once_per_path(self, tmp_path):
+        """Should not recreate a file it already confirmed until forgotten."""
+        config_path = tmp_path / "config.toml"
+        ensure_config_exists(config_path)
+        config_path.unlink()
+
+        ensure_config_exists(config_path)
+        assert not config_path.exists()
+
+        forget_ensured(config_path)
+        ensure_config_exists(config_path)
+        assert config_path.exists()
+
 
 class TestLoadConfig:
     """Test load_config() function."""
@@ -116,6 +146,59 @@ class TestLoadConfig:
 
         assert result["profiles"]["office"]["device"]["mac"] == "AA:BB:CC:DD:EE:FF"
 
+    def test_reuses_parse_until_file_changes(self, tmp_path, monkeypatch):
+        """Should parse once per file version and hand out independent copies."""
+        from bbl_shutter_cam import config as config_mod
+
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('key = "a"\n')
+        parses = []
+        real_load = config_mod._load_readonly
+        monkeypatch.setattr(
+            config_mod, "_load_readonly", lambda path: parses.append(path) or real_load(path)
+        )
+
+        first = load_config(config_path)
+        first["key"] = "mutated"
+        second = load_config(config_path)
+
+        assert second["key"] == "a"
+        assert len(parses) == 1
+
+        config_path.write_text('key = "bb"\n')
+        assert load_config(config_path)["key"] == "bb"
+        assert len(parses) == 2
+
+    def test_leaves_no_files_next_to_config(self, tmp_path):
+        """Should cache in memory only, writing nothing beside config.toml."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('key = "a"\n')
+
+        load_config(config_path)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["config.toml"]
+
+
+class TestLoadConfigEditable:
+    """Test load_config_editable() function."""
+
+    def test_round_trip_keeps_comments(self, tmp_path):
+        """Should preserve comments when a loaded document is saved again."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('# keep me\ndefault_profile = "a"\n')
+
+        cfg = load_config_editable(config_path)
+        cfg["default_profile"] = "b"
+        save_config(cfg, config_path)
+
+        assert "# keep me" in config_path.read_text()
+        assert load_config(config_path)["default_profile"] == "b"
+
+    def test_raises_on_missing_file(self, tmp_path):
+        """Should raise FileNotFoundError if config doesn't exist."""
+        with pytest.raises(FileNotFoundError):
+            load_config_editable(tmp_path / "nonexistent.toml")
+
 
 class TestSaveConfig:
     """Test save_config() function."""
@@ -140,6 +223,18 @@ class TestSaveConfig:
         assert config_path.parent.exists()
         assert config_path.exists()
 
+    def test_skips_write_when_content_unchanged(self, tmp_path, monkeypatch):
+        """Should not rewrite a file that already holds the same TOML."""
+        from bbl_shutter_cam import config as config_mod
+
+        config_path = tmp_path / "config.toml"
+        save_config({"data": "value"}, config_path)
+        update_profile_device_fields(config_path, "office", "AA:BB", "uuid-1")
+        monkeypatch.setattr(config_mod, "_atomic_write_text", lambda *_a: pytest.fail("wrote"))
+
+        save_config(load_config_editable(config_path), config_path)
+        update_profile_device_fields(config_path, "office", "AA:BB", "uuid-1")
+
     def test_overwrites_existing_file(self, tmp_path):
         """Should overwrite existing config file."""
         config_path = tmp_path / "config.toml"
@@ -151,6 +246,22 @@ class TestSaveConfig:
         assert "new" in loaded
         assert "old" not in loaded
 
+    def test_replaces_file_atomically(self, tmp_path, monkeypatch):
+        """Should leave the original intact if the write fails."""
+        from bbl_shutter_cam import config as config_mod
+
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('old = "data"\n')
+
+        def failing_replace(_src, _dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(config_mod.os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            save_config({"new": "data"}, config_path)
+
+        assert config_path.read_text() == 'old = "data"\n'
+
 
 class TestLoadProfile:
     """Test load_profile() function."""
@@ -196,6 +307,49 @@ class TestLoadProfile:
         assert "camera" in prof
         assert "rpicam" in prof["camera"]
 
+    def test_returns_cached_read_only_profile(self, tmp_path):
+        """Should build a frozen Profile once per config file version."""
+        config_path = tmp_path / "config.toml"
+        ensure_config_exists(config_path)
+
+        prof = load_profile(config_path, "default")
+
+        assert isinstance(prof, Profile)
+        assert prof.name == "default"
+        assert prof.rpicam["width"] == 1920
+        assert prof.triggers == frozenset({b"\x40\x00", b"\x80\x00"})
+        assert load_profile(config_path, "default") is prof
+        with pytest.raises(TypeError):
+            prof["camera"]["rpicam"]["width"] = 640  # type: ignore[index]
+
+        cfg = load_config(config_path)
+        cfg["profiles"]["default"]["camera"]["rpicam"]["width"] = 3840
+        save_config(cfg, config_path)
+
+        assert load_profile(config_path, "default").rpicam["width"] == 3840
+
+    def test_interns_event_strings(self, tmp_path):
+        """Should share one string object for repeated UUIDs across events."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text(
+            "[profiles.office.device]\n"
+            'events = [{uuid = "u-1", hex = "4000", capture = true},'
+            ' {uuid = "u-1", hex = "8000", capture = true}]\n'
+        )
+
+        first, second = load_profile(config_path, "office").events
+
+        assert first["uuid"] is second["uuid"]
+
+    def test_accepts_space_separated_trigger_hex(self, tmp_path):
+        """Should load triggers written with spaces between bytes."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text(
+            "[profiles.office.device]\n" 'events = [{hex = "40 00", capture = true}]\n'
+        )
+
+        assert load_profile(config_path, "office").triggers == frozenset({b"\x40\x00"})
+
     def test_raises_on_missing_profiles_section(self, tmp_path):
         """Should raise KeyError if [profiles] section missing."""
         config_path = tmp_path / "config.toml"
@@ -282,6 +436,15 @@ class TestGetTriggerEvents:
         for event in capture_events:
             assert event["capture"] is True
 
+    def test_defaults_are_shared_and_read_only(self):
+        """Default events should be one shared, immutable sequence."""
+        first = get_trigger_events({"device": {}})
+        second = get_trigger_events({})
+
+        assert first is second
+        with pytest.raises(TypeError):
+            first[0]["capture"] = False  # type: ignore[index]
+
 
 class TestGetEventTriggerBytes:
     """Test get_event_trigger_bytes() function."""
@@ -311,10 +474,10 @@ class TestGetEventTriggerBytes:
 
         result = get_event_trigger_bytes(profile)
 
-        assert result == [b"\xab\xcd"]
+        assert result == frozenset({b"\xab\xcd"})
 
-    def test_returns_empty_list_when_no_capture_events(self):
-        """Should return empty list if no events have capture=True."""
+    def test_returns_empty_set_when_no_capture_events(self):
+        """Should return an empty set if no events have capture=True."""
         profile = {
             "device": {
                 "events": [
@@ -326,7 +489,7 @@ class TestGetEventTriggerBytes:
 
         result = get_event_trigger_bytes(profile)
 
-        assert result == []
+        assert result == frozenset()
 
     def test_handles_empty_events_list(self):
         """Should return default triggers when no events configured."""
@@ -358,6 +521,35 @@ class TestGetEventTriggerBytes:
         assert b"\x40\x00" in result
         assert b"\x80\x00" in result
 
+    def test_skips_odd_length_and_empty_hex(self, capsys):
+        """Should reject hex that is not whole bytes, with a warning."""
+        profile = {
+            "device": {
+                "events": [
+                    {"hex": "400", "capture": True},
+                    {"hex": "", "capture": True},
+                    {"hex": "4000", "capture": True},
+                ]
+            }
+        }
+
+        result = get_event_trigger_bytes(profile)
+
+        assert result == frozenset({b"\x40\x00"})
+        assert "'400'" in capsys.readouterr().out
+
+    def test_accepts_padded_and_uppercase_hex(self):
+        """Should normalize surrounding whitespace and case."""
+        profile = {"device": {"events": [{"hex": " ABCD\n", "capture": True}]}}
+
+        assert get_event_trigger_bytes(profile) == frozenset({b"\xab\xcd"})
+
+    def test_accepts_spaces_between_bytes(self):
+        """Should accept "40 00" as bytes.fromhex() does."""
+        profile = {"device": {"events": [{"hex": "40 00", "capture": True}]}}
+
+        assert get_event_trigger_bytes(profile) == frozenset({b"\x40\x00"})
+
 
 class TestUpdateProfileDeviceFields:
     """Test update_profile_device_fields() function."""
@@ -414,6 +606,19 @@ class TestUpdateProfileDeviceFields:
         cfg = load_config(config_path)
         assert cfg["default_profile"] == "office"
 
+    def test_updates_passed_document_without_reloading(self, tmp_path, monkeypatch):
+        """Should reuse a document the caller already loaded."""
+        from bbl_shutter_cam import config as config_mod
+
+        config_path = tmp_path / "config.toml"
+        ensure_config_exists(config_path)
+        cfg = load_config_editable(config_path)
+        monkeypatch.setattr(config_mod, "load_config_editable", lambda _p: pytest.fail("reloaded"))
+
+        update_profile_device_fields(config_path, "default", "AA:BB", "uuid", cfg=cfg)
+
+        assert load_config(config_path)["profiles"]["default"]["device"]["mac"] == "AA:BB"
+
     def test_preserves_other_settings(self, tmp_path):
         """Should preserve other profile settings when updating device fields."""
         config_path = tmp_path / "config.toml"
@@ -435,3 +640,14 @@ class TestUpdateProfileDeviceFields:
         assert cfg["profiles"]["default"]["camera"]["rpicam"]["width"] == 3840
         # Device fields should be updated
         assert cfg["profiles"]["default"]["device"]["mac"] == "AA:BB:CC:DD:EE:FF"
+
+    def test_quotes_profile_names_that_are_not_bare_keys(self, tmp_path):
+        """Should handle profile names that need quoting in TOML."""
+        config_path = tmp_path / "config.toml"
+        ensure_config_exists(config_path)
+
+        update_profile_device_fields(config_path, "my office", "AA:BB", "uuid-1")
+
+        cfg = load_config(config_path)
+        assert cfg["profiles"]["my office"]["device"]["mac"] == "AA:BB"
+        assert cfg["default_profile"] == "my office"
@@ -1,8 +1,10 @@
 """Unit tests for discover.py module."""
 
 import asyncio
+from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
 
 import pytest
@@ -18,22 +20,65 @@ class FakeDevice:
     address: str
 
 
+class FakeProc:
+    def __init__(self, returncode=0, stderr=b""):
+        self.returncode = returncode
+        self._stderr = stderr
+
+    async def communicate(self):
+        return b"", self._stderr
+
+
+@pytest.fixture(autouse=True)
+def no_camera_session(monkeypatch):
+    """Keep run_profile on the rpicam-still path so tests never open a real camera."""
+    monkeypatch.setattr(discover, "open_camera_session", lambda _cfg: None)
+
+
 def test_scan_filters_by_name(monkeypatch):
+    class FakeScanner:
+        def __init__(self, detection_callback):
+            self.callback = detection_callback
+
+        async def start(self):
+            adv = SimpleNamespace(local_name=None)
+            self.callback(FakeDevice(name="Other", address="CC:DD"), adv)
+            self.callback(FakeDevice(name=None, address="EE:FF"), adv)
+            self.callback(FakeDevice(name="BBL_SHUTTER", address="AA:BB"), adv)
+            self.callback(FakeDevice(name="BBL_SHUTTER", address="AA:BB"), adv)
+
+        async def stop(self):
+            return None
+
     async def fake_discover(timeout=8.0):
-        return [
-            FakeDevice(name="BBL_SHUTTER", address="AA:BB"),
-            FakeDevice(name="Other", address="CC:DD"),
-            FakeDevice(name=None, address="EE:FF"),
-        ]
+        return [FakeDevice(name="BBL_SHUTTER", address="AA:BB")]
 
-    monkeypatch.setattr(discover.BleakScanner, "discover", fake_discover)
+    monkeypatch.setattr(discover, "BleakScanner", FakeScanner)
+    FakeScanner.discover = staticmethod(fake_discover)
 
-    hits = asyncio.run(discover.scan(name_filter="BBL_SHUTTER", timeout=0.1))
-    assert len(hits) == 1
-    assert hits[0].address == "AA:BB"
+    hits = asyncio.run(discover.scan(name_filter="BBL_SHUTTER", timeout=5.0))
+    assert [d.address for d in hits] == ["AA:BB"]
 
     all_hits = asyncio.run(discover.scan(name_filter=None, timeout=0.1))
-    assert len(all_hits) == 3
+    assert len(all_hits) == 1
+
+
+def test_scan_matches_advertised_name_and_times_out(monkeypatch):
+    class FakeScanner:
+        def __init__(self, detection_callback):
+            self.callback = detection_callback
+
+        async def start(self):
+            self.callback(
+                FakeDevice(name=None, address="AA:BB"), SimpleNamespace(local_name="Other")
+            )
+
+        async def stop(self):
+            return None
+
+    monkeypatch.setattr(discover, "BleakScanner", FakeScanner)
+
+    assert asyncio.run(discover.scan(name_filter="BBL_SHUTTER", timeout=0.01)) == []
 
 
 def test_setup_profile_uses_scan_and_updates_config(monkeypatch, tmp_path):
@@ -89,8 +134,8 @@ def test_update_config_with_signals(tmp_path):
     config_path.write_text(dumps(cfg))
 
     seen_data = {
-        "uuid-1": [bytes.fromhex("4000"), bytes.fromhex("0000"), bytes.fromhex("4000")],
-        "uuid-2": [bytes.fromhex("8000")],
+        "uuid-1": Counter(["4000", "0000", "4000"]),
+        "uuid-2": Counter(["8000"]),
     }
 
     discover._update_config_with_signals(config_path, "office", seen_data)
@@ -102,6 +147,8 @@ def test_update_config_with_signals(tmp_path):
     # Ensure release signal is marked non-capturing
     release = [e for e in events if e["hex"] == "0000"][0]
     assert release["capture"] is False
+    # Most frequent signal first, with its count
+    assert (events[0]["hex"], events[0]["count"]) == ("4000", 2)
 
 
 def test_debug_signals_updates_config(monkeypatch, tmp_path):
@@ -109,13 +156,13 @@ def test_debug_signals_updates_config(monkeypatch, tmp_path):
         def __init__(self):
             self.is_connected = True
 
-        async def start_notify(self, _uuid, callback):
-            callback(0, bytearray.fromhex("4000"))
+        async def start_notify(self, uuid, callback):
+            callback(SimpleNamespace(uuid=uuid), bytearray.fromhex("4000"))
 
         async def disconnect(self):
             self.is_connected = False
 
-    async def fake_connect(_mac):
+    async def fake_connect(_mac, **_kwargs):
         return FakeClient()
 
     async def fake_list_notify(_client):
@@ -147,7 +194,42 @@ def test_debug_signals_updates_config(monkeypatch, tmp_path):
     )
 
     assert called["profile"] == "office"
-    assert "uuid-1" in called["seen"]
+    assert called["seen"] == {"uuid-1": Counter({"4000": 1})}
+
+
+def test_debug_signals_prints_each_signal_and_can_skip_dec(monkeypatch, tmp_path, capsys):
+    class FakeClient:
+        is_connected = True
+
+        async def start_notify(self, uuid, callback):
+            callback(SimpleNamespace(uuid=uuid), bytearray.fromhex("4000"))
+
+        async def disconnect(self):
+            return None
+
+    async def fake_connect(_mac, **_kwargs):
+        return FakeClient()
+
+    async def fake_list_notify(_client):
+        return ["uuid-1"]
+
+    async def fake_sleep(_duration):
+        return None
+
+    monkeypatch.setattr(discover.ble, "connect_with_retry", fake_connect)
+    monkeypatch.setattr(discover.ble, "list_notify_characteristics", fake_list_notify)
+    monkeypatch.setattr(discover.asyncio, "sleep", fake_sleep)
+
+    for show_dec in (True, False):
+        asyncio.run(
+            discover.debug_signals(
+                tmp_path / "config.toml", "office", "AA:BB", 0.1, False, show_dec
+            )
+        )
+        out = capsys.readouterr().out
+        assert "HEX: 4000" in out
+        assert "LEN: 2 bytes" in out
+        assert ("DEC:  64   0" in out) is show_dec
 
 
 def test_run_profile_captures_on_trigger(monkeypatch):
@@ -162,7 +244,7 @@ def test_run_profile_captures_on_trigger(monkeypatch):
         async def disconnect(self):
             self.is_connected = False
 
-    async def fake_connect(_mac, reconnect_delay=2.0):
+    async def fake_connect(_mac, **_kwargs):
         if not hasattr(fake_connect, "called"):
             fake_connect.called = True
             return FakeClient()
@@ -177,14 +259,14 @@ def test_run_profile_captures_on_trigger(monkeypatch):
     def fake_build_cmd(_cfg, outfile):
         return ["rpicam-still", "-o", outfile]
 
-    def fake_run(_cmd, check=True):
-        return None
+    async def fake_exec(*_cmd, **_kwargs):
+        return FakeProc()
 
     monkeypatch.setattr(discover.ble, "connect_with_retry", fake_connect)
     monkeypatch.setattr(discover.asyncio, "sleep", fake_sleep)
     monkeypatch.setattr(discover, "make_outfile", fake_make_outfile)
     monkeypatch.setattr(discover, "build_rpicam_still_cmd", fake_build_cmd)
-    monkeypatch.setattr(discover.subprocess, "run", fake_run)
+    monkeypatch.setattr(discover.asyncio, "create_subprocess_exec", fake_exec)
 
     profile = {
         "_profile_name": "office",
@@ -200,3 +282,448 @@ def test_run_profile_captures_on_trigger(monkeypatch):
     }
 
     asyncio.run(discover.run_profile(profile, dry_run=False))
+
+
+def test_run_profile_ignores_unknown_payloads_and_debounces(monkeypatch):
+    runs = []
+
+    class FakeClient:
+        def __init__(self):
+            self.is_connected = True
+
+        async def start_notify(self, _uuid, callback):
+            callback(0, bytearray.fromhex("1234"))
+            callback(0, bytearray.fromhex("400000"))
+            callback(0, bytearray.fromhex("4000"))
+            callback(0, bytearray.fromhex("4000"))
+            self.is_connected = False
+
+        async def disconnect(self):
+            self.is_connected = False
+
+    async def fake_connect(_mac, **_kwargs):
+        if not hasattr(fake_connect, "called"):
+            fake_connect.called = True
+            return FakeClient()
+        raise KeyboardInterrupt()
+
+    monkeypatch.setattr(discover.ble, "connect_with_retry", fake_connect)
+    monkeypatch.setattr(discover, "make_outfile", lambda _cfg: "/tmp/out.jpg")
+
+    async def fake_exec(*cmd, **_kwargs):
+        runs.append(cmd)
+        return FakeProc()
+
+    monkeypatch.setattr(discover.asyncio, "create_subprocess_exec", fake_exec)
+
+    profile = {
+        "device": {
+            "mac": "AA:BB",
+            "notify_uuid": "uuid-1",
+            "events": [{"hex": "4000", "capture": True}],
+        },
+        "camera": {"output_dir": "/tmp", "min_interval_sec": 60},
+    }
+
+    asyncio.run(discover.run_profile(profile))
+
+    assert len(runs) == 1
+
+
+def test_capture_logs_success_and_failure(monkeypatch, capsys):
+    procs = [FakeProc(), FakeProc(returncode=1, stderr=b"no camera")]
+
+    async def fake_exec(*_cmd, **_kwargs):
+        return procs.pop(0)
+
+    monkeypatch.setattr(discover.asyncio, "create_subprocess_exec", fake_exec)
+
+    asyncio.run(discover._capture(["rpicam-still"], "/tmp/a.jpg"))
+    asyncio.run(discover._capture(["rpicam-still"], "/tmp/b.jpg"))
+
+    out = capsys.readouterr().out
+    assert "Captured: /tmp/a.jpg" in out
+    assert "exit 1" in out and "no camera" in out
+
+
+def test_capture_logs_missing_binary(monkeypatch, capsys):
+    async def fake_exec(*_cmd, **_kwargs):
+        raise FileNotFoundError("rpicam-still")
+
+    monkeypatch.setattr(discover.asyncio, "create_subprocess_exec", fake_exec)
+
+    asyncio.run(discover._capture(["rpicam-still"], "/tmp/a.jpg"))
+
+    assert "rpicam-still failed" in capsys.readouterr().out
+
+
+def test_debug_signals_subscribes_concurrently_and_reports_failures(monkeypatch, tmp_path, capsys):
+    class FakeClient:
+        is_connected = True
+
+        async def start_notify(self, uuid, _callback):
+            if uuid == "uuid-bad":
+                raise RuntimeError("not permitted")
+
+        async def disconnect(self):
+            return None
+
+    async def fake_connect(_mac, **_kwargs):
+        return FakeClient()
+
+    async def fake_list_notify(_client):
+        return ["uuid-1", "uuid-bad", "uuid-2"]
+
+    async def fake_sleep(_duration):
+        return None
+
+    monkeypatch.setattr(discover.ble, "connect_with_retry", fake_connect)
+    monkeypatch.setattr(discover.ble, "list_notify_characteristics", fake_list_notify)
+    monkeypatch.setattr(discover.asyncio, "sleep", fake_sleep)
+
+    asyncio.run(discover.debug_signals(tmp_path / "config.toml", "office", "AA:BB", 0.1))
+
+    out = capsys.readouterr().out
+    assert "Failed to subscribe to uuid-bad: not permitted" in out
+    assert "Successfully subscribed to 2/3 characteristics" in out
+
+
+def test_run_profile_captures_through_camera_session(monkeypatch):
+    class FakeSession:
+        def __init__(self):
+            self.shots = []
+            self.closed = False
+
+        def capture(self, outfile):
+            self.shots.append(outfile)
+
+        def close(self):
+            self.closed = True
+
+    class FakeClient:
+        is_connected = True
+
+        async def start_notify(self, _uuid, callback):
+            callback(0, bytearray.fromhex("4000"))
+            self.is_connected = False
+
+        async def disconnect(self):
+            return None
+
+    async def fake_connect(_mac, **_kwargs):
+        if not hasattr(fake_connect, "called"):
+            fake_connect.called = True
+            return FakeClient()
+        raise KeyboardInterrupt()
+
+    async def fake_exec(*_cmd, **_kwargs):
+        pytest.fail("rpicam-still should not run when a session is open")
+
+    session = FakeSession()
+    monkeypatch.setattr(discover, "open_camera_session", lambda _cfg: session)
+    monkeypatch.setattr(discover.ble, "connect_with_retry", fake_connect)
+    monkeypatch.setattr(discover, "make_outfile", lambda _cfg: "/tmp/out.jpg")
+    monkeypatch.setattr(discover.asyncio, "create_subprocess_exec", fake_exec)
+
+    profile = {
+        "device": {"mac": "AA:BB", "notify_uuid": "uuid-1"},
+        "camera": {"output_dir": "/tmp"},
+    }
+
+    asyncio.run(discover.run_profile(profile))
+
+    assert session.shots == ["/tmp/out.jpg"]
+    assert session.closed
+
+
+def test_run_profile_uses_rpicam_still_for_settings_session_cannot_apply(monkeypatch):
+    from bbl_shutter_cam import camera
+
+    runs = []
+
+    class FakeClient:
+        is_connected = True
+
+        async def start_notify(self, _uuid, callback):
+            callback(0, bytearray.fromhex("4000"))
+            self.is_connected = False
+
+        async def disconnect(self):
+            return None
+
+    async def fake_connect(_mac, **_kwargs):
+        if not hasattr(fake_connect, "called"):
+            fake_connect.called = True
+            return FakeClient()
+        raise KeyboardInterrupt()
+
+    async def fake_exec(*cmd, **_kwargs):
+        runs.append(cmd)
+        return FakeProc()
+
+    def fail_session(_cfg):
+        pytest.fail("CameraSession cannot apply denoise")
+
+    monkeypatch.setattr(discover, "open_camera_session", camera.open_camera_session)
+    monkeypatch.setattr(camera, "CameraSession", fail_session)
+    monkeypatch.setattr(discover.ble, "connect_with_retry", fake_connect)
+    monkeypatch.setattr(discover, "make_outfile", lambda _cfg: "/tmp/out.jpg")
+    monkeypatch.setattr(discover.asyncio, "create_subprocess_exec", fake_exec)
+
+    profile = {
+        "device": {"mac": "AA:BB", "notify_uuid": "uuid-1"},
+        "camera": {"output_dir": "/tmp", "rpicam": {"denoise": "cdn_hq"}},
+    }
+
+    asyncio.run(discover.run_profile(profile))
+
+    assert len(runs) == 1 and "--denoise" in runs[0]
+
+
+def test_run_profile_skips_triggers_rejected_at_load(monkeypatch, capsys):
+    async def fake_connect(_mac, **_kwargs):
+        raise KeyboardInterrupt()
+
+    monkeypatch.setattr(discover.ble, "connect_with_retry", fake_connect)
+
+    profile = {
+        "device": {
+            "mac": "AA:BB",
+            "notify_uuid": "uuid-1",
+            "events": [
+                {"hex": " ABCD ", "capture": True},
+                {"hex": "40 00", "capture": True},
+                {"hex": "zz", "capture": True},
+            ],
+        },
+        "camera": {"output_dir": "/tmp"},
+    }
+
+    asyncio.run(discover.run_profile(profile, dry_run=True))
+
+    out = capsys.readouterr().out
+    assert "Configured triggers: 2" in out
+    assert "invalid hex 'zz'" in out
+
+
+def test_run_profile_waits_for_disconnect_callback(monkeypatch):
+    connects = []
+
+    class FakeClient:
+        is_connected = True
+
+        def __init__(self, on_disconnect):
+            self.on_disconnect = on_disconnect
+
+        async def start_notify(self, _uuid, _callback):
+            asyncio.get_running_loop().call_later(0.01, self.on_disconnect, self)
+
+        async def disconnect(self):
+            return None
+
+    async def fake_connect(_mac, disconnected_callback=None, **_kwargs):
+        connects.append(disconnected_callback)
+        if len(connects) > 1:
+            raise KeyboardInterrupt()
+        return FakeClient(disconnected_callback)
+
+    async def fail_sleep(_duration):
+        pytest.fail("run_profile should not poll the connection")
+
+    monkeypatch.setattr(discover.ble, "connect_with_retry", fake_connect)
+    monkeypatch.setattr(discover.asyncio, "sleep", fail_sleep)
+
+    profile = {
+        "device": {"mac": "AA:BB", "notify_uuid": "uuid-1"},
+        "camera": {"output_dir": "/tmp"},
+    }
+
+    asyncio.run(discover.run_profile(profile, dry_run=True))
+
+    assert len(connects) == 2 and connects[0] is not None
+
+
+def test_run_profile_invalidates_service_cache_when_notify_fails(monkeypatch):
+    connects = []
+    invalidated = []
+
+    class FakeClient:
+        async def start_notify(self, _uuid, _callback):
+            raise RuntimeError("handle not found")
+
+        async def disconnect(self):
+            return None
+
+    async def fake_connect(_mac, **_kwargs):
+        connects.append(_mac)
+        if len(connects) > 1:
+            raise KeyboardInterrupt()
+        return FakeClient()
+
+    monkeypatch.setattr(discover.ble, "connect_with_retry", fake_connect)
+    monkeypatch.setattr(discover.ble, "invalidate_cache", invalidated.append)
+
+    profile = {
+        "device": {"mac": "AA:BB", "notify_uuid": "uuid-1"},
+        "camera": {"output_dir": "/tmp"},
+    }
+
+    asyncio.run(discover.run_profile(profile, dry_run=True))
+
+    assert invalidated == ["AA:BB"]
+
+
+def test_learn_notify_uuid_returns_uuid_that_sent_press(monkeypatch):
+    stopped = []
+
+    class FakeClient:
+        async def start_notify(self, uuid, callback):
+            loop = asyncio.get_running_loop()
+            payload = b"\x40\x00" if uuid == "uuid-2" else b"\x01"
+            loop.call_soon(callback, SimpleNamespace(uuid=uuid), bytearray(payload))
+
+        async def stop_notify(self, uuid):
+            stopped.append(uuid)
+
+        async def disconnect(self):
+            return None
+
+    async def fake_connect(_mac, **_kwargs):
+        return FakeClient()
+
+    async def fake_list_notify(_client):
+        return ["uuid-1", "uuid-2"]
+
+    monkeypatch.setattr(discover.ble, "connect_with_retry", fake_connect)
+    monkeypatch.setattr(discover.ble, "list_notify_characteristics", fake_list_notify)
+
+    uuid = asyncio.run(discover.learn_notify_uuid("AA:BB", press_timeout=1.0))
+
+    assert uuid == "uuid-2"
+    assert sorted(stopped) == ["uuid-1", "uuid-2"]
+
+
+def test_run_profile_collapses_presses_during_capture(monkeypatch):
+    events = []
+
+    class SlowProc(FakeProc):
+        def __init__(self, name):
+            super().__init__()
+            self.name = name
+
+        async def communicate(self):
+            events.append(("start", self.name))
+            await asyncio.sleep(0.01)
+            events.append(("end", self.name))
+            return b"", b""
+
+    class FakeClient:
+        is_connected = True
+
+        async def start_notify(self, _uuid, callback):
+            callback(0, bytearray.fromhex("4000"))
+            await asyncio.sleep(0.001)  # let the first capture start
+            callback(0, bytearray.fromhex("4000"))
+            callback(0, bytearray.fromhex("4000"))
+            self.is_connected = False
+
+        async def disconnect(self):
+            return None
+
+    async def fake_connect(_mac, **_kwargs):
+        if not hasattr(fake_connect, "called"):
+            fake_connect.called = True
+            return FakeClient()
+        raise KeyboardInterrupt()
+
+    names = iter(["a.jpg", "b.jpg", "c.jpg"])
+
+    async def fake_exec(*cmd, **_kwargs):
+        return SlowProc(cmd[cmd.index("-o") + 1])
+
+    monkeypatch.setattr(discover.ble, "connect_with_retry", fake_connect)
+    monkeypatch.setattr(discover, "make_outfile", lambda _cfg: next(names))
+    monkeypatch.setattr(discover.asyncio, "create_subprocess_exec", fake_exec)
+
+    profile = {
+        "device": {"mac": "AA:BB", "notify_uuid": "uuid-1"},
+        "camera": {"output_dir": "/tmp", "min_interval_sec": 0},
+    }
+
+    asyncio.run(discover.run_profile(profile))
+
+    # b.jpg was queued behind a.jpg, then replaced by the later press
+    assert events == [("start", "a.jpg"), ("end", "a.jpg"), ("start", "c.jpg"), ("end", "c.jpg")]
+
+
+@pytest.mark.parametrize("duration", [0, 3600])
+def test_debug_signals_listen_ends_on_disconnect(monkeypatch, tmp_path, duration):
+    class FakeClient:
+        is_connected = True
+
+        def __init__(self, on_disconnect):
+            self.on_disconnect = on_disconnect
+
+        async def start_notify(self, _uuid, _callback):
+            asyncio.get_running_loop().call_later(0.01, self.on_disconnect, self)
+
+        async def disconnect(self):
+            return None
+
+    async def fake_connect(_mac, disconnected_callback=None):
+        return FakeClient(disconnected_callback)
+
+    async def fake_list_notify(_client):
+        return ["uuid-1"]
+
+    async def fail_sleep(_duration):
+        pytest.fail("debug_signals should not poll the connection")
+
+    monkeypatch.setattr(discover.ble, "connect_with_retry", fake_connect)
+    monkeypatch.setattr(discover.ble, "list_notify_characteristics", fake_list_notify)
+    monkeypatch.setattr(discover.asyncio, "sleep", fail_sleep)
+
+    listen = discover.debug_signals(tmp_path / "config.toml", "office", "AA:BB", duration=duration)
+    asyncio.run(asyncio.wait_for(listen, timeout=5))
+
+
+def test_debug_signals_waits_for_consumer_and_reports_tail(monkeypatch, tmp_path, capsys):
+    consumer_done = []
+
+    class SlowRing(discover.ble.NotifyRing):
+        async def drain(self):
+            try:
+                # Never hand a batch over, so only the final pop_all() reports it
+                await asyncio.Event().wait()
+            finally:
+                consumer_done.append(True)
+
+    class FakeClient:
+        is_connected = True
+
+        def __init__(self, on_disconnect):
+            self.on_disconnect = on_disconnect
+
+        async def start_notify(self, _uuid, callback):
+            callback(SimpleNamespace(uuid="uuid-1"), bytearray(b"\x40\x00"))
+            asyncio.get_running_loop().call_later(0.01, self.on_disconnect, self)
+
+        async def disconnect(self):
+            return None
+
+    async def fake_connect(_mac, disconnected_callback=None):
+        return FakeClient(disconnected_callback)
+
+    async def fake_list_notify(_client):
+        return ["uuid-1"]
+
+    monkeypatch.setattr(discover.ble, "NotifyRing", SlowRing)
+    monkeypatch.setattr(discover.ble, "connect_with_retry", fake_connect)
+    monkeypatch.setattr(discover.ble, "list_notify_characteristics", fake_list_notify)
+
+    async def run():
+        await discover.debug_signals(tmp_path / "config.toml", "office", "AA:BB", duration=0)
+        return list(consumer_done)
+
+    assert asyncio.run(run()) == [True]
+    assert "HEX: 4000" in capsys.readouterr().out
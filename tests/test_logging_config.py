@@ -3,6 +3,8 @@
 import logging
 from pathlib import Path
 
+import pytest
+
 from bbl_shutter_cam import logging_config
 
 
@@ -38,6 +40,12 @@ def test_setup_logging_without_color():
     assert any(isinstance(h.formatter, logging.Formatter) for h in logger.handlers)
 
 
+@pytest.mark.parametrize("level", ["LOUD", "basic_format"])
+def test_setup_logging_rejects_unknown_level(level):
+    with pytest.raises(ValueError, match="Invalid log level"):
+        logging_config.setup_logging(level=level)
+
+
 def test_setup_logging_with_file(tmp_path):
     log_file = tmp_path / "app.log"
 
@@ -51,3 +59,23 @@ def test_get_logger():
     logger = logging_config.get_logger("test.module")
 
     assert logger.name == "test.module"
+
+
+def test_color_formatter_leaves_record_uncolored():
+    formatter = logging_config.ColorFormatter("%(levelname)s | %(message)s")
+    record = logging.LogRecord(
+        name="test",
+        level=logging.WARNING,
+        pathname=__file__,
+        lineno=1,
+        msg="careful",
+        args=(),
+        exc_info=None,
+    )
+
+    first = formatter.format(record)
+    second = formatter.format(record)
+
+    assert first == second == "\033[33mWARNING\033[0m | careful"
+    assert record.levelname == "WARNING"
+    assert logging.Formatter("%(levelname)s").format(record) == "WARNING"
@@ -63,16 +63,20 @@ def test_take_test_photo_success(monkeypatch, tmp_path):
 
     called = {}
 
-    def fake_run(cmd, check=True, capture_output=True):
+    def fake_run(cmd, **kwargs):
         called["cmd"] = cmd
+        called["kwargs"] = kwargs
         return None
 
     monkeypatch.setattr(tune.subprocess, "run", fake_run)
+    monkeypatch.setattr(tune, "open_camera_session", lambda _cfg: None)
 
     outfile = session.take_test_photo()
 
     assert outfile is not None
     assert called["cmd"][0] == "rpicam-still"
+    assert called["kwargs"]["stdout"] is subprocess.DEVNULL
+    assert called["kwargs"]["stderr"] is subprocess.PIPE
 
 
 def test_take_test_photo_failure(monkeypatch, tmp_path):
@@ -86,12 +90,89 @@ def test_take_test_photo_failure(monkeypatch, tmp_path):
         raise subprocess.CalledProcessError(1, ["rpicam-still"], stderr=b"fail")
 
     monkeypatch.setattr(tune.subprocess, "run", fake_run)
+    monkeypatch.setattr(tune, "open_camera_session", lambda _cfg: None)
 
     outfile = session.take_test_photo()
 
     assert outfile is None
 
 
+def test_take_test_photo_reuses_camera_session_until_settings_change(monkeypatch, tmp_path):
+    config_path = tmp_path / "config.toml"
+    output_dir = tmp_path / "captures"
+    _write_minimal_config(config_path, "office", output_dir)
+
+    class FakeCamera:
+        def __init__(self, cam):
+            self.cam = cam
+            self.shots = []
+            self.closed = False
+
+        def capture(self, outfile):
+            self.shots.append(outfile)
+
+        def close(self):
+            self.closed = True
+
+    opened = []
+
+    def fake_open(cam):
+        opened.append(FakeCamera(cam))
+        return opened[-1]
+
+    def fail_run(*_args, **_kwargs):
+        pytest.fail("rpicam-still should not run when a session is open")
+
+    monkeypatch.setattr(tune, "open_camera_session", fake_open)
+    monkeypatch.setattr(tune.subprocess, "run", fail_run)
+
+    session = tune.TuningSession(config_path, "office")
+    first = session.take_test_photo()
+    second = session.take_test_photo()
+    session.update_setting(ev=0.5)
+    third = session.take_test_photo()
+    session.close()
+
+    assert len(opened) == 2
+    assert opened[0].shots == [first, second] and opened[0].closed
+    assert opened[1].shots == [third] and opened[1].closed
+    assert opened[1].cam.ev == 0.5
+
+
+def test_take_test_photo_falls_back_when_session_cannot_apply_settings(monkeypatch, tmp_path):
+    from bbl_shutter_cam import camera
+
+    config_path = tmp_path / "config.toml"
+    output_dir = tmp_path / "captures"
+    _write_minimal_config(config_path, "office", output_dir)
+
+    class FakeCamera:
+        def __init__(self, cam):
+            self.cam = cam
+            self.closed = False
+            opened.append(self)
+
+        def capture(self, outfile):
+            pass
+
+        def close(self):
+            self.closed = True
+
+    opened = []
+    runs = []
+    monkeypatch.setattr(camera, "CameraSession", FakeCamera)
+    monkeypatch.setattr(tune, "open_camera_session", camera.open_camera_session)
+    monkeypatch.setattr(tune.subprocess, "run", lambda cmd, **_kwargs: runs.append(cmd))
+
+    session = tune.TuningSession(config_path, "office")
+    session.take_test_photo()
+    session.update_setting(denoise="cdn_hq")
+    session.take_test_photo()
+
+    assert len(opened) == 1 and opened[0].closed
+    assert len(runs) == 1 and "--denoise" in runs[0]
+
+
 def test_handle_rotation_valid(monkeypatch, tmp_path):
     config_path = tmp_path / "config.toml"
     output_dir = tmp_path / "captures"
@@ -191,6 +272,23 @@ def test_run_tuning_menu_exit(monkeypatch, tmp_path):
     tune.run_tuning_menu(session)
 
 
+def test_run_tuning_menu_dispatches_choices(monkeypatch, tmp_path, capsys):
+    config_path = tmp_path / "config.toml"
+    output_dir = tmp_path / "captures"
+    _write_minimal_config(config_path, "office", output_dir)
+
+    session = tune.TuningSession(config_path, "office")
+
+    inputs = iter(["r", "90", "", "zz", "", "x"])
+    monkeypatch.setattr("builtins.input", lambda _="": next(inputs))
+    monkeypatch.setattr(session, "show_current_settings", lambda: None)
+
+    tune.run_tuning_menu(session)
+
+    assert session.cam_config.rotation == 90
+    assert "Unknown option: zz" in capsys.readouterr().out
+
+
 def test_rollback_restores_original(tmp_path):
     config_path = tmp_path / "config.toml"
     output_dir = tmp_path / "captures"
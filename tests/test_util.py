@@ -9,6 +9,7 @@ from pathlib import Path
 
 import pytest
 
+from bbl_shutter_cam import util
 from bbl_shutter_cam.util import (
     LogLevel,
     Logger,
@@ -70,6 +71,33 @@ class TestLogger:
         captured = capsys.readouterr()
         assert "Debug message" not in captured.out
 
+    def test_suppressed_debug_does_not_format_args(self):
+        """Should not stringify %-style arguments for suppressed messages."""
+
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("formatted")
+
+        logger = Logger(level=LogLevel.INFO, fmt="plain")
+
+        logger.debug("Value: %s", Exploding())
+
+    def test_enabled_for_follows_threshold(self):
+        """Should report whether a level would be written."""
+        logger = Logger(level=LogLevel.INFO, fmt="plain")
+
+        assert not logger.enabled_for(LogLevel.DEBUG)
+        assert logger.enabled_for(LogLevel.INFO)
+        assert logger.enabled_for(LogLevel.ERROR)
+
+    def test_debug_formats_args_at_debug_level(self, capsys):
+        """Should apply %-style arguments when the message is emitted."""
+        logger = Logger(level=LogLevel.DEBUG, fmt="plain")
+
+        logger.debug("Found %d item(s) for %s", 3, "AA:BB")
+
+        assert "[D] Found 3 item(s) for AA:BB" in capsys.readouterr().out
+
     def test_debug_shown_at_debug_level(self, capsys):
         """Should log debug messages when level is DEBUG."""
         logger = Logger(level=LogLevel.DEBUG, fmt="plain")
@@ -117,6 +145,37 @@ class TestLogger:
         assert "[=] Test" in captured.out
         assert len(captured.out.split()) >= 3  # Date, time, tag, message
 
+    def test_time_format_reuses_timestamp_within_a_second(self, monkeypatch, capsys):
+        """Timestamp should be formatted once per second, not per line."""
+        clock = iter([1000.1, 1000.9, 1001.0])
+        calls = []
+        real_strftime = util.time.strftime
+
+        def counting_strftime(fmt, t):
+            calls.append(t)
+            return real_strftime(fmt, t)
+
+        monkeypatch.setattr(util.time, "time", lambda: next(clock))
+        monkeypatch.setattr(util.time, "strftime", counting_strftime)
+        logger = Logger(level=LogLevel.INFO, fmt="time")
+
+        for _ in range(3):
+            logger.info("Test")
+
+        lines = capsys.readouterr().out.splitlines()
+        assert len(calls) == 2
+        assert lines[0] == lines[1] != lines[2]
+
+    def test_level_change_rebinds_disabled_methods(self, capsys):
+        """Methods below the level should be no-ops until the level is lowered."""
+        logger = Logger(level=LogLevel.WARNING, fmt="plain")
+
+        logger.info("hidden %s", "arg")
+        logger.level = LogLevel.DEBUG
+        logger.debug("shown %s", "arg")
+
+        assert capsys.readouterr().out.strip() == "[D] shown arg"
+
     def test_file_output(self, tmp_path):
         """Should write to file when file handle provided."""
         log_file = tmp_path / "test.log"
@@ -127,6 +186,17 @@ class TestLogger:
         content = log_file.read_text()
         assert "[=] File message" in content
 
+    def test_file_output_batches_only_debug(self, tmp_path):
+        """Debug lines should stay buffered until an info line flushes them."""
+        log_file = tmp_path / "test.log"
+        with open(log_file, "w", buffering=8192) as f:
+            logger = Logger(level=LogLevel.DEBUG, fmt="plain", file=f)
+            logger.debug("Buffered")
+            assert log_file.read_text() == ""
+
+            logger.info("Flushed")
+            assert log_file.read_text() == "[D] Buffered\n[=] Flushed\n"
+
     def test_file_output_with_stringio(self):
         """Should write to StringIO file-like object."""
         output = StringIO()
@@ -231,11 +301,37 @@ class TestConfigureLogging:
 
         assert LOG.level == LogLevel.DEBUG
 
+    def test_accepts_log_level_enum(self):
+        """Should accept a LogLevel as well as its name."""
+        configure_logging(level=LogLevel.WARNING, fmt="plain")
+
+        from bbl_shutter_cam.util import LOG
+
+        assert LOG.level == LogLevel.WARNING
+
     def test_raises_on_invalid_level(self):
         """Should raise ValueError for unrecognized levels."""
         with pytest.raises(ValueError, match="Invalid log level"):
             configure_logging(level="invalid", fmt="plain")
 
+    def test_reconfiguring_log_file_closes_previous_one(self, tmp_path, monkeypatch):
+        """A second log file should replace the first, which is flushed and closed."""
+        monkeypatch.setattr(util.LOG, "file", None)
+        first_path = tmp_path / "first.log"
+        second_path = tmp_path / "second.log"
+
+        configure_logging(level="debug", fmt="plain", log_file=first_path)
+        first = util.LOG.file
+        util.LOG.debug("Batched")
+        configure_logging(level="debug", fmt="plain", log_file=second_path)
+        try:
+            assert first.closed
+            assert "[D] Batched" in first_path.read_text()
+            assert util.LOG.file is not first
+        finally:
+            util._close_log_file()
+            util.LOG.level = LogLevel.INFO
+
     def test_sets_plain_format(self):
         """Should set format to plain."""
         configure_logging(level="info", fmt="plain")